@@ -1,26 +1,350 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from utils.emissions_calculator import EmissionsCalculator
-from utils.pdf_generator import PDFGenerator
-from utils.data_validator import DataValidator
+from datetime import datetime
 from utils.auth import SimpleAuth
 from utils.data_storage import DataStorage
-from utils.compliance_engine import ComplianceEngine
-from utils.pdf_report_generator import ComplianceReportGenerator
-from data.regulatory_database import RegulatoryDatabase
+from data.emission_factors import ACTIVITY_LABELS
+import functools
+import string
+from heapq import nlargest
+from operator import itemgetter
 import io
-import base64
 import os
+import re
+from pathlib import Path
 
-def get_logo_base64():
-    """Convert logo image to base64 for HTML embedding"""
-    try:
-        with open("assets/logo.png", "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    except:
-        return ""
+@st.cache_data(show_spinner=False)
+def load_asset(name):
+    """Load a static HTML snippet from assets/ (read once per process)"""
+    return (Path("assets") / name).read_text(encoding="utf-8")
+
+# The logo is served from static/logo.png (enableStaticServing in
+# .streamlit/config.toml) so the browser caches it instead of re-parsing a
+# base64 blob embedded in every render
+_LOGO_URL = "app/static/logo.png"
+
+# Template paths never change while the process runs - probe them once at
+# import instead of issuing a stat() syscall on every rerun
+_MATERIAL_TEMPLATE_PATH = "templates/rolling_sphere_template.xlsx"
+_CO2_TEMPLATE_PATH = "templates/Rolling_Sphere_Complete_CO2_Template_1755947979815.xlsx"
+_HAS_MATERIAL_TEMPLATE = os.path.exists(_MATERIAL_TEMPLATE_PATH)
+_HAS_CO2_TEMPLATE = os.path.exists(_CO2_TEMPLATE_PATH)
+
+_HEADER_HTML = f"""
+<div style='text-align: center; margin-bottom: 20px;'>
+    <div style='display: flex; align-items: center; justify-content: center; margin-bottom: 5px; margin-top: -10px;'>
+        <img src="{_LOGO_URL}" style='width: 60px; height: 60px; margin-right: 15px;'>
+        <h1 style='color: #1f77b4; margin: 0; display: inline-block;'>Rolling Sphere</h1>
+    </div>
+    <h3 style='color: #666; margin-top: 5px;'>Hazardous Substances Compliance Center</h3>
+</div>
+"""
+
+_DARK_HEADER_HTML = f"""
+<div style='background-color: #1a1a1a; padding: 15px 20px; margin: -1rem -1rem 0 -1rem; border-radius: 0;'>
+    <div style='display: flex; justify-content: space-between; align-items: center;'>
+        <div style='display: flex; align-items: center;'>
+            <img src="{_LOGO_URL}" style='width: 40px; height: 40px; margin-right: 12px;'>
+            <div>
+                <h1 style='color: #1f77b4; margin: 0; font-size: 24px; font-weight: 600;'>Rolling Sphere</h1>
+                <p style='color: #888; margin: 0; font-size: 14px;'>Hazardous Substances Compliance Center</p>
+            </div>
+        </div>
+    </div>
+</div>
+"""
+
+# Shared service singletons - constructing these per rerun re-opens DB
+# connections and re-parses the regulatory database
+@st.cache_resource(show_spinner=False)
+def get_auth():
+    return SimpleAuth()
+
+@st.cache_resource(show_spinner=False)
+def get_storage():
+    return DataStorage()
+
+@st.cache_resource(show_spinner=False)
+def get_compliance_engine():
+    from utils.compliance_engine import ComplianceEngine
+    return ComplianceEngine()
+
+@st.cache_resource(show_spinner=False)
+def get_report_generator():
+    from utils.pdf_report_generator import ComplianceReportGenerator
+    return ComplianceReportGenerator()
+
+@st.cache_resource(show_spinner=False)
+def get_regulatory_database():
+    from data.regulatory_database import get_regulatory_database as get_db
+    return get_db()
+
+@st.cache_resource(show_spinner=False)
+def get_co2_template_bytes():
+    """Read the CO2 calculator template once; None when it is missing"""
+    if not _HAS_CO2_TEMPLATE:
+        return None
+    with open(_CO2_TEMPLATE_PATH, "rb") as template_file:
+        return template_file.read()
+
+@st.cache_resource(show_spinner=False)
+def get_regulation_partition():
+    """Regulations grouped by region plus the verified subset.
+
+    One pass over the database feeds the statistics row and the
+    no-search browse path instead of each section rescanning the list.
+    """
+    by_region = {}
+    verified = []
+    for reg in get_regulatory_database().get_all_regulations():
+        by_region.setdefault(reg.region, []).append(reg)
+        if "✅ Verified" in reg.verification_status:
+            verified.append(reg)
+    return by_region, verified
+
+@st.cache_resource(show_spinner=False)
+def get_regulation_stats():
+    """Summary counts for the database statistics row, derived from the
+    cached region partition."""
+    by_region, verified = get_regulation_partition()
+    region_counts = {region: len(regs) for region, regs in by_region.items()}
+    return sum(region_counts.values()), region_counts, len(verified)
+
+@st.cache_resource(show_spinner=False)
+def get_regulation_search_index():
+    """Regulations paired with lowercased search fields, built once.
+
+    The database browser filters on every keystroke; precomputing the
+    lowercase name/scope/authority strings keeps that to substring checks.
+    """
+    return [
+        (reg, reg.name.lower(), reg.scope.lower(), reg.authority.lower())
+        for reg in get_regulatory_database().get_all_regulations()
+    ]
+
+@st.cache_resource(show_spinner=False)
+def get_material_template_bytes():
+    """Read the material-declaration template once; None when it is missing"""
+    if not _HAS_MATERIAL_TEMPLATE:
+        return None
+    with open(_MATERIAL_TEMPLATE_PATH, "rb") as template_file:
+        return template_file.read()
+
+@st.cache_data(show_spinner=False)
+def run_compliance_analysis(df, regs):
+    """Run the compliance engine once per (file, regulations) combination.
+
+    The report branch and the results section both need the same analysis;
+    memoizing on the DataFrame contents and regulation tuple means it
+    executes once instead of twice per report and not at all on reruns.
+    """
+    return get_compliance_engine().analyze_file_compliance(df, list(regs))
+
+@st.cache_data(show_spinner=False)
+def parse_material_upload(name, data):
+    """Parse an uploaded material declaration, cached on filename + bytes.
+
+    Excel parsing is expensive; keying on the raw bytes means reruns after
+    the upload hit the cache instead of re-parsing. .xlsx goes through the
+    Rust-backed calamine engine, which is far faster than openpyxl on
+    large workbooks; legacy .xls stays on xlrd.
+    """
+    file_extension = name.split('.')[-1].lower()
+    if file_extension == 'csv':
+        return pd.read_csv(io.BytesIO(data))
+    if file_extension == 'xlsx':
+        return pd.read_excel(io.BytesIO(data), engine='calamine')
+    if file_extension == 'xls':
+        return pd.read_excel(io.BytesIO(data), engine='xlrd')
+    return None
+
+@st.cache_data(show_spinner=False)
+def parse_emissions_upload(name, data):
+    """Parse an uploaded emissions file, cached on filename + bytes.
+
+    CSV loads directly; Excel goes through the vectorized extraction that
+    skips SCOPE banners and repeated header rows.
+    """
+    if name.endswith('.csv'):
+        return pd.read_csv(io.BytesIO(data))
+    headers = ['company_name', 'activity_type', 'category', 'amount', 'unit', 'date']
+    if name.endswith('.xlsx'):
+        # Stream rows with read-only openpyxl instead of materializing the
+        # whole sheet as a DataFrame first; only rows surviving the filter
+        # are ever held
+        from openpyxl import load_workbook
+        workbook = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+        data_rows = []
+        try:
+            for row in workbook.active.iter_rows(values_only=True):
+                first = row[0] if row else None
+                if first is None:
+                    continue
+                first_str = str(first)
+                if (not first_str.strip() or 'SCOPE' in first_str
+                        or first_str.strip() == 'company_name'):
+                    continue
+                clean_row = [str(cell) if cell is not None else '' for cell in row[:6]]
+                if len(clean_row) >= 4 and clean_row[1]:  # Must have activity_type
+                    data_rows.append(clean_row)
+        finally:
+            workbook.close()
+        return pd.DataFrame(
+            data_rows,
+            columns=headers[:len(data_rows[0])] if data_rows else headers
+        )
+    # Legacy .xls still goes through pandas
+    excel_data = pd.read_excel(io.BytesIO(data), header=None)
+    col0 = excel_data.iloc[:, 0]
+    col0_str = col0.astype(str).str.strip()
+    mask = (col0.notna() & col0_str.ne('')
+            & ~col0_str.str.contains('SCOPE', regex=False)
+            & col0_str.ne('company_name'))
+    df = excel_data.loc[mask].iloc[:, :6]
+    # Stringify with NaN -> '' in one pass, matching the old per-cell cleanup
+    df = df.where(df.notna(), '').astype(str)
+    if df.shape[1] >= 4:
+        df = df[df.iloc[:, 1] != ''].reset_index(drop=True)  # Must have activity_type
+    else:
+        df = df.iloc[0:0]
+    df.columns = headers[:df.shape[1]]
+    return df
+
+@st.cache_data(show_spinner=False)
+def validate_emissions_data(df):
+    """Validate an emissions DataFrame once per unique upload.
+
+    Returns (passed, errors) so cache hits replay the same messages.
+    """
+    from utils.data_validator import DataValidator
+    validator = DataValidator()
+    return validator.validate_data(df), validator.get_errors()
+
+@st.cache_data(show_spinner=False)
+def compute_emissions(df):
+    """Run the emissions calculation once per unique upload"""
+    from utils.emissions_calculator import EmissionsCalculator
+    return EmissionsCalculator().calculate_emissions(df)
+
+# Slice/bar caps before chart data is rolled into an "Other" bucket;
+# every extra pie slice costs an outside label and its layout pass
+_PIE_MAX_SLICES = 12
+_BAR_MAX_BARS = 20
+
+def _top_n(items, n):
+    """Largest n (name, value) pairs with the tail summed into 'other'"""
+    if len(items) <= n:
+        return items
+    ranked = sorted(items, key=lambda pair: pair[1], reverse=True)
+    return ranked[:n] + [('other', sum(value for _, value in ranked[n:]))]
+
+@st.cache_data(show_spinner=False)
+def build_activity_pie(items):
+    """Pie of emissions by activity, cached on the aggregated (name, kg) pairs"""
+    import plotly.express as px
+
+    items = _top_n(items, _PIE_MAX_SLICES)
+    activity_names = [_pretty_label(name) for name, _ in items]
+    fig = px.pie(
+        values=[value for _, value in items],
+        names=activity_names,
+        title="Emissions by Activity Type"
+    )
+    # Improve label positioning to avoid overlap; skip the slice pull on
+    # dense pies where it only makes label layout worse
+    fig.update_traces(
+        textposition='outside',
+        textinfo='percent+label',
+        pull=[0.05] * len(activity_names) if len(activity_names) <= 8 else None
+    )
+    fig.update_layout(
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="left",
+            x=1.01
+        ),
+        margin=dict(l=20, r=120, t=50, b=20),
+        uirevision='constant'
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_category_bar(items):
+    """Bar chart of emissions by category, cached on the aggregated pairs"""
+    import plotly.express as px
+
+    items = _top_n(items, _BAR_MAX_BARS)
+    fig = px.bar(
+        x=[_pretty_label(name) for name, _ in items],
+        y=[value for _, value in items],
+        title="Emissions by Category",
+        labels={'x': 'Category', 'y': 'CO2 Emissions (kg)'}
+    )
+    # Rotate x-axis labels to prevent overlap
+    fig.update_layout(
+        xaxis_tickangle=-45,
+        margin=dict(b=100),
+        uirevision='constant'
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_monthly_line(items):
+    """Monthly trend line, cached on the (month, kg) pairs"""
+    import plotly.express as px
+
+    fig = px.line(
+        x=[month for month, _ in items],
+        y=[value for _, value in items],
+        title="Monthly Emissions Trend",
+        labels={'x': 'Month', 'y': 'CO2 Emissions (kg)'}
+    )
+    fig.update_layout(uirevision='constant')
+    return fig
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_dashboard_bundle(username):
+    """Fetch history and recent calculations once and precompute summary stats.
+
+    Short TTL so freshly saved calculations still show up, while repeated
+    reruns within a session skip the storage round-trips and pandas
+    reductions.
+    """
+    storage = get_storage()
+    history_df = storage.get_calculation_history(username)
+    calculations = storage.get_user_calculations(username, limit=5)
+    has_history = len(history_df) > 0
+    return {
+        'history_df': history_df,
+        'calculations': calculations,
+        'latest_emissions': float(history_df['total_emissions'].iloc[0]) if has_history else 0.0,
+        'avg_emissions': float(history_df['total_emissions'].mean()) if has_history else 0.0,
+    }
+
+@st.cache_data(show_spinner=False)
+def build_trend_figure(history_df):
+    """Build the dashboard emissions trend chart (cached on the history data).
+
+    Uses a WebGL Scattergl trace instead of plotly.express so repeated reruns
+    reuse the memoized figure rather than rebuilding it from scratch.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Scattergl(
+        x=history_df['date'],
+        y=history_df['total_emissions'],
+        mode='lines'
+    ))
+    fig.update_layout(
+        title="CO2 Emissions Over Time",
+        xaxis_title="Date",
+        yaxis_title="CO2 Emissions (kg)",
+        showlegend=False
+    )
+    return fig
 
 # Configure page
 st.set_page_config(
@@ -29,11 +353,405 @@ st.set_page_config(
     layout="wide"
 )
 
+# Smart product recognition patterns
+_PRODUCT_RECOGNITION_PATTERNS = {
+    # Computing & Telecommunications
+    "Computing & Telecommunications": {
+        "keywords": ["smartphone", "phone", "iphone", "samsung galaxy", "laptop", "computer", "macbook",
+                   "tablet", "ipad", "server", "router", "switch", "modem", "network"],
+        "types": {
+            "smartphone|phone|iphone|samsung|galaxy": "Smartphones",
+            "laptop|macbook|notebook": "Laptops",
+            "computer|desktop|pc": "Desktop Computers",
+            "tablet|ipad": "Tablets",
+            "server": "Servers",
+            "router|switch|modem": "Network Equipment"
+        }
+    },
+    # Consumer Electronics
+    "Consumer Electronics": {
+        "keywords": ["tv", "television", "monitor", "display", "audio", "speaker", "camera", "gaming", "console"],
+        "types": {
+            "tv|television": "TVs",
+            "monitor|display": "Monitors",
+            "audio|speaker|sound": "Audio Systems",
+            "camera": "Cameras",
+            "gaming|console|playstation|xbox": "Gaming Consoles"
+        }
+    },
+    # Household Appliances
+    "Household Appliances": {
+        "keywords": ["washing machine", "refrigerator", "fridge", "microwave", "dishwasher", "air conditioner"],
+        "types": {
+            "washing machine|washer": "Washing Machines",
+            "refrigerator|fridge": "Refrigerators",
+            "microwave": "Microwaves",
+            "dishwasher": "Dishwashers",
+            "air conditioner|ac": "Air Conditioners"
+        }
+    },
+    # Components & Accessories
+    "Components & Accessories": {
+        "keywords": ["cable", "led cable", "usb cable", "hdmi cable", "power cable", "network cable",
+                   "audio cable", "adapter", "battery", "charger", "connector", "mouse", "keyboard", "webcam", "microphone", "headphone"],
+        "types": {
+            "led cable": "LED Cables",
+            "usb cable": "USB Cables",
+            "hdmi cable": "HDMI Cables",
+            "power cable": "Power Cables",
+            "network cable": "Network Cables",
+            "audio cable": "Audio Cables",
+            "cable": "Cables",
+            "adapter": "Adapters",
+            "battery": "Batteries",
+            "charger": "Chargers",
+            "mouse": "Computer Mouse",
+            "keyboard": "Keyboards",
+            "webcam": "Webcams",
+            "microphone|mic": "Microphones",
+            "headphone|headset": "Headphones"
+        }
+    }
+}
+
+# Precompile the recognition regexes once at import - they were recompiled on
+# every keystroke when detection ran inside the render loop
+_COMPILED_PATTERNS = {
+    category: {
+        "keywords": patterns["keywords"],
+        "types": [(re.compile(pattern), product_type) for pattern, product_type in patterns["types"].items()]
+    }
+    for category, patterns in _PRODUCT_RECOGNITION_PATTERNS.items()
+}
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Single-pass keyword scanner across all categories. One combined alternation
+# replaces the per-category, per-keyword substring loop; longer keywords come
+# first so "usb cable" wins over "cable".
+_KEYWORD_CATEGORY = {
+    keyword: category
+    for category, patterns in _PRODUCT_RECOGNITION_PATTERNS.items()
+    for keyword in patterns["keywords"]
+}
+_KEYWORD_SCAN_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(_KEYWORD_CATEGORY, key=len, reverse=True))
+)
+
+# Enhanced product categories with comprehensive cable types and subcategories.
+# Tuples rather than lists so the literals are allocated once at import
+_PRODUCT_CATEGORIES = {
+    "Computing & Telecommunications": (
+        "Smartphones", "Tablets", "Laptops", "Desktop Computers", "Servers",
+        "Routers", "Switches", "Modems", "Network Equipment", "Data Storage Devices"
+    ),
+    "Consumer Electronics": (
+        "TVs", "Monitors", "Audio Systems", "Cameras", "Gaming Consoles", "Smart Home Devices",
+        "Wearables", "E-readers", "Streaming Devices", "Headphones", "Speakers"
+    ),
+    "Household Appliances": (
+        "Washing Machines", "Refrigerators", "Microwaves", "Dishwashers", "Air Conditioners",
+        "Vacuum Cleaners", "Coffee Machines", "Food Processors", "Electric Ovens", "Water Heaters"
+    ),
+    "Components & Accessories": (
+        "LED Cables", "USB Cables", "HDMI Cables", "Power Cables", "Network Cables", "Audio Cables",
+        "Adapters", "Batteries", "Circuit Boards", "Power Supplies", "Memory Cards",
+        "USB Devices", "Chargers", "Connectors", "Electronic Components", "Computer Mouse",
+        "Keyboards", "Webcams", "Microphones", "Headphones", "Other"
+    ),
+    "Industrial Equipment": (
+        "Control Systems", "Sensors", "Motors", "PLCs", "Industrial Computers",
+        "Measurement Devices", "Automation Equipment", "Power Electronics", "Drives", "HMI Panels"
+    ),
+    "Medical Devices": (
+        "Diagnostic Equipment", "Monitoring Devices", "Therapeutic Equipment", "Laboratory Equipment",
+        "Imaging Systems", "Patient Monitors", "Infusion Pumps", "Defibrillators", "Ventilators", "MRI Systems"
+    )
+}
+
+# Dropdown options derived from the categories, materialized once instead of
+# rebuilding list concatenations for every product form on every rerun
+_CATEGORY_OPTIONS = tuple(_PRODUCT_CATEGORIES.keys()) + ("Custom Product",)
+_TYPE_OPTIONS = {
+    category: subcategories + ("Other in this category",)
+    for category, subcategories in _PRODUCT_CATEGORIES.items()
+}
+
+# Cable-type suggestions for the Smart Suggestions panel. One precompiled
+# alternation pass over the description replaces per-type substring scans
+_CABLE_KEYWORDS = {
+    cable_type.lower().replace(" cables", ""): cable_type
+    for cable_type in ("LED Cables", "USB Cables", "HDMI Cables",
+                       "Power Cables", "Network Cables", "Audio Cables")
+}
+_CABLE_SUGGESTION_RE = re.compile("|".join(map(re.escape, _CABLE_KEYWORDS)))
+
+# Top suggestions shown per category, sliced once instead of per form
+# render
+_CATEGORY_TOP_SUGGESTIONS = {
+    category: subcategories[:4]
+    for category, subcategories in _PRODUCT_CATEGORIES.items()
+}
+
+# EU member states - frozenset so the membership checks in
+# get_applicable_regulations are O(1) hash lookups
+EU_COUNTRIES = frozenset({
+    "Germany", "France", "Italy", "Netherlands", "Belgium", "Spain", "Austria",
+    "Portugal", "Finland", "Denmark", "Sweden", "Poland", "Czech Republic",
+    "Hungary", "Slovakia", "Slovenia", "Croatia", "Romania", "Bulgaria",
+    "Lithuania", "Latvia", "Estonia", "Luxembourg", "Cyprus", "Malta",
+    "Ireland", "Greece"
+})
+
+# Target-market regulations keyed by the exact multiselect option: each
+# entry is (base regulations, category-specific extras). One dict lookup
+# per market replaces the old cascade of substring checks
+_MARKET_REGS = {
+    "United States": (
+        ("California Proposition 65", "TSCA", "FCC Regulations", "CPSIA"),
+        {"Computing & Telecommunications": ("FCC Part 15",)},
+    ),
+    "China": (
+        ("China RoHS", "CCC Certification", "GB Standards", "China WEEE"),
+        {"Computing & Telecommunications": ("CCC for IT Equipment", "SRRC Approval"),
+         "Medical Devices": ("NMPA Registration",)},
+    ),
+    "India": (
+        ("India E-Waste Rules", "BIS Standards", "Environment Protection Act", "Hazardous Waste Rules"),
+        {"Computing & Telecommunications": ("BIS Registration", "WPC Approval", "TEC Approval"),
+         "Medical Devices": ("CDSCO Registration",)},
+    ),
+    "European Union": (
+        ("RoHS Directive", "REACH", "WEEE Directive", "CE Marking"),
+        {"Medical Devices": ("Medical Device Regulation",),
+         "Computing & Telecommunications": ("Radio Equipment Directive", "EMC Directive")},
+    ),
+    "Japan": (
+        ("Japan RoHS", "Japan WEEE", "PSE Certification", "VCCI Standards"),
+        {"Computing & Telecommunications": ("MIC Type Approval",)},
+    ),
+    "South Korea": (
+        ("Korea RoHS", "K-REACH", "WEEE Korea", "KC Certification"),
+        {"Computing & Telecommunications": ("KCC Approval",)},
+    ),
+    "Global Market": (
+        ("IEC Standards", "ISO Environmental", "Global Best Practices", "International Trade Requirements"),
+        {},
+    ),
+}
+
+# Alternate spellings normalized to the canonical dict keys above
+_MARKET_ALIASES = {"USA": "United States", "EU": "European Union"}
+
+@functools.lru_cache(maxsize=512)
+def get_applicable_regulations(role, location, markets, category):
+    """Determine applicable regulations based on business context - UNIVERSAL for ALL locations.
+
+    Memoized: the same (role, location, markets, category) tuples recur on
+    every rerun, so repeat calls are dict lookups. `markets` must be a tuple.
+    """
+    # Insertion-ordered dict doubles as an ordered set, so duplicates are
+    # dropped on insert instead of in a final dedup pass
+    applicable_regs = {}
+
+    # UNIVERSAL MANUFACTURING LOCATION REGULATIONS
+    if location in EU_COUNTRIES:
+        applicable_regs.update(dict.fromkeys(["RoHS Directive", "REACH", "WEEE Directive", "EMC Directive", "Packaging Directive", "Radio Equipment Directive"]))
+    elif location == "China":
+        applicable_regs.update(dict.fromkeys(["China RoHS", "CCC Certification", "GB Standards", "China Manufacturing Standards"]))
+    elif location == "India":
+        applicable_regs.update(dict.fromkeys(["India E-Waste Rules", "BIS Standards", "Environment Protection Act", "Pollution Control Act"]))
+    elif location in ["United States", "USA"]:
+        applicable_regs.update(dict.fromkeys(["EPA Regulations", "OSHA Standards", "FCC Manufacturing", "State Environmental Laws"]))
+    elif location in ["Japan", "South Korea", "Singapore", "Taiwan"]:
+        applicable_regs.update(dict.fromkeys(["WEEE Equivalent", "Chemical Safety Standards", "Manufacturing Safety"]))
+    else:
+        # Generic regulations for any other manufacturing location
+        applicable_regs.update(dict.fromkeys(["International Standards", "Local Environmental Laws", "Safety Standards"]))
+
+    # UNIVERSAL TARGET MARKET REGULATIONS
+    for market in markets:
+        entry = _MARKET_REGS.get(_MARKET_ALIASES.get(market, market))
+        if market == "European Union" and location in EU_COUNTRIES:
+            # Already covered by the manufacturing-location block above;
+            # keep only the generic market-entry entries
+            entry = None
+
+        if entry is not None:
+            base_regs, category_extras = entry
+            applicable_regs.update(dict.fromkeys(base_regs))
+            extras = category_extras.get(category)
+            if extras:
+                applicable_regs.update(dict.fromkeys(extras))
+        else:
+            # Generic regulations for any other target market
+            applicable_regs.update(dict.fromkeys([f"{market} Market Entry Requirements", f"{market} Safety Standards", f"{market} Environmental Compliance"]))
+
+    return list(applicable_regs)
+
+# Overall-status levels by combined scope 1+3 share of total emissions;
+# the first entry whose bound is not exceeded applies
+_STATUS_LEVELS = (
+    (60, ("🟢 GOOD PERFORMANCE", "#00aa00", "Performance acceptable")),
+    (80, ("🟡 ATTENTION NEEDED", "#ff8800", "Performance acceptable")),
+    (float("inf"), ("🔴 ACTION REQUIRED", "#ff4444", "Scope 1+3 > 80% requires action")),
+)
+
+@functools.lru_cache(maxsize=None)
+def _pretty_label(name):
+    """Display label for an activity/category key, title-cased on first use
+    when it falls outside the precomputed table"""
+    return ACTIVITY_LABELS.get(name) or name.replace('_', ' ').title()
+
+def format_activities(activities, limit=None):
+    """Human-readable activity list, truncated to `limit` with a +N tail"""
+    shown = activities if limit is None else activities[:limit]
+    text = ', '.join(_pretty_label(act) for act in shown)
+    if limit is not None and len(activities) > limit:
+        text += f" +{len(activities) - limit} more"
+    return text
+
+# Executive-summary HTML, parsed once at import; the render path only
+# substitutes the computed values
+_EXEC_SUMMARY_TEMPLATE = string.Template("""
+<div style='background: linear-gradient(135deg, #f0f8ff, #e6f3ff); border: 2px solid #1f77b4; border-radius: 15px; padding: 20px; margin: 20px 0;'>
+    <div style='text-align: center; margin-bottom: 15px;'>
+        <h2 style='color: #1f77b4; margin: 0;'>📊 EXECUTIVE SUMMARY</h2>
+    </div>
+    <div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; align-items: center;'>
+        <div style='text-align: center; padding: 10px;'>
+            <h3 style='color: #333; margin: 5px;'>Total Emissions</h3>
+            <h1 style='color: #1f77b4; margin: 5px; font-size: 2.2em;'>${emissions_tons}</h1>
+            <p style='color: #666; margin: 0;'>tonnes CO2e</p>
+        </div>
+        <div style='text-align: center;'>
+            <div style='background: #ff4444; color: white; padding: 8px 12px; border-radius: 8px; margin: 3px;'>
+                <strong>SCOPE 1: ${scope1_tonnes}t (${scope1_percent}%) - RED</strong>
+            </div>
+            <div style='background: #00aa00; color: white; padding: 8px 12px; border-radius: 8px; margin: 3px;'>
+                <strong>SCOPE 2: ${scope2_tonnes}t (${scope2_percent}%) - GREEN</strong>
+            </div>
+            <div style='background: #ff8800; color: white; padding: 8px 12px; border-radius: 8px; margin: 3px;'>
+                <strong>SCOPE 3: ${scope3_tonnes}t (${scope3_percent}%) - ORANGE</strong>
+            </div>
+        </div>
+        <div style='text-align: center; padding: 10px;'>
+            <h3 style='color: ${status_color}; margin: 5px;'>Overall Status</h3>
+            <h2 style='color: ${status_color}; margin: 5px; font-size: 1.4em;'>${overall_status}</h2>
+            <p style='color: #666; margin: 0; font-size: 12px;'>${status_note}</p>
+        </div>
+    </div>
+</div>
+""")
+
+# Scope-recommendation cards: the HTML shell is fixed per scope, so only
+# the tonnage and activity text are formatted in at render time
+_SCOPE_CARD_TEMPLATE = (
+    "<div style='border-left: 4px solid {color}; padding: 15px; background: {background}; border-radius: 8px;'>"
+    "<h5 style='color: {color}; margin: 0 0 10px 0;'>{icon} SCOPE {num} ({tonnes:.2f}t)</h5>"
+    "<p style='margin: 5px 0; font-size: 14px; color: #333;'><strong>{kind} emissions from: {activities}</strong></p>"
+    "<p style='margin: 10px 0; font-size: 12px; color: #666;'>{advice}</p>"
+    "</div>"
+)
+
+_SCOPE_EMPTY_TEMPLATE = (
+    "<div style='border-left: 4px solid #00aa00; padding: 15px; background: #f5fff5; border-radius: 8px;'>"
+    "<h5 style='color: #00aa00; margin: 0 0 10px 0;'>✅ SCOPE {num} (0.0t)</h5>"
+    "<p style='margin: 5px 0; font-size: 14px; color: #333;'><strong>No {kind} emissions detected</strong></p>"
+    "</div>"
+)
+
+# Per-scope styling and copy: (color, background, icon, kind phrase,
+# advice line, empty-card phrase)
+_SCOPE_CARD_STYLES = {
+    1: ("#ff4444", "#fff5f5", "🔴", "Direct",
+        "Consider energy efficiency improvements and equipment upgrades for these activities.",
+        "direct"),
+    2: ("#00aa00", "#f5fff5", "🟢", "Energy",
+        "Consider renewable energy sources and energy efficiency measures.",
+        "energy"),
+    3: ("#ff8800", "#fff8f0", "🟠", "Indirect",
+        "Consider supply chain optimization and process improvements for these activities.",
+        "indirect"),
+}
+
+# Report footer: everything except the generation timestamp is static
+_FOOTER_TEMPLATE = """
+<div style='background: linear-gradient(135deg, #1f77b4, #4dabf7); color: white; border-radius: 10px; padding: 20px; margin: 20px 0; text-align: center;'>
+    <div style='font-size: 18px; font-weight: bold; margin-bottom: 10px;'>🏢 Rolling Sphere Technologies - CO2 Analysis Report</div>
+    <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-top: 15px;'>
+        <div>
+            <div style='font-size: 14px; opacity: 0.9;'>Report Generated:</div>
+            <div style='font-weight: bold;'>{date}</div>
+        </div>
+        <div>
+            <div style='font-size: 14px; opacity: 0.9;'>Contact:</div>
+            <div style='font-weight: bold;'>rollingsphere.project@gmail.com</div>
+        </div>
+    </div>
+    <div style='margin-top: 15px; font-size: 12px; opacity: 0.8;'>
+        Professional Environmental Analysis | Official Emission Factor Sources
+    </div>
+</div>
+"""
+
+_METHODOLOGY_HTML = """
+<div style='background: #f0f8ff; border: 1px solid #1f77b4; border-radius: 10px; padding: 20px; margin: 15px 0;'>
+    <h4 style='color: #1f77b4; margin-bottom: 15px;'>📊 Data Sources & Standards</h4>
+    <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 15px;'>
+        <div style='display: flex; align-items: center;'><span style='color: #00aa00; font-size: 18px;'>✓</span> <strong style='margin-left: 8px;'>UK Government GHG Conversion Factors 2023</strong></div>
+        <div style='display: flex; align-items: center;'><span style='color: #00aa00; font-size: 18px;'>✓</span> <strong style='margin-left: 8px;'>EPA Emission Factors for GHG Inventories</strong></div>
+        <div style='display: flex; align-items: center;'><span style='color: #00aa00; font-size: 18px;'>✓</span> <strong style='margin-left: 8px;'>IPCC Guidelines for National GHG Inventories</strong></div>
+        <div style='display: flex; align-items: center;'><span style='color: #00aa00; font-size: 18px;'>✓</span> <strong style='margin-left: 8px;'>GHG Protocol Scope Classification</strong></div>
+    </div>
+    <p style='color: #666; font-size: 12px; margin-top: 15px; text-align: center;'>All emission factors sourced from official government and international standards</p>
+</div>
+"""
+
+# Session-state defaults applied in main() on every rerun. Callables are
+# factories so each session gets its own fresh instance
+_SESSION_DEFAULTS = {
+    'calculated_data': None,
+    'company_info': dict,
+    'show_calculator': False,
+    'show_hazardous_substances': False,
+    'show_compliance_analysis': False,
+    'show_all_regulations': False,
+    'show_contact': False,
+    'show_privacy': False,
+}
+
+# Top-level page flags cleared on every navigation so a stale True can't
+# route a rerun through the wrong page
+_PAGE_FLAGS = (
+    'show_calculator', 'show_hazardous_substances',
+    'show_contact', 'show_privacy', 'show_all_regulations',
+)
+
+def _goto(page=None):
+    """Navigate to a top-level page (or the dashboard when page is None)."""
+    for flag in _PAGE_FLAGS:
+        st.session_state[flag] = False
+    if page:
+        st.session_state[page] = True
+    st.rerun()
+
+# Product forms rendered per page on the compliance workflow
+_PRODUCT_PAGE_SIZE = 5
+
+# Comprehensive country list for the business-context form
+_COUNTRIES = (
+    "Germany", "USA", "China", "India", "Japan", "South Korea", "Singapore",
+    "United Kingdom", "France", "Italy", "Netherlands", "Sweden", "Denmark",
+    "Canada", "Brazil", "Mexico", "Australia", "New Zealand", "South Africa",
+    "Thailand", "Malaysia", "Vietnam", "Philippines", "Indonesia", "Taiwan",
+    "Hong Kong", "Switzerland", "Austria", "Belgium", "Spain", "Poland",
+    "Czech Republic", "Hungary", "Romania", "Turkey", "Russia", "Other"
+)
+
 def show_cookie_banner():
     """Display GDPR-compliant cookie banner"""
     # Initialize cookie consent if not set
-    if 'cookie_consent' not in st.session_state:
-        st.session_state.cookie_consent = None
+    st.session_state.setdefault('cookie_consent', None)
     
     # Only show banner if no consent given
     if st.session_state.cookie_consent is None:
@@ -86,18 +804,11 @@ def show_cookie_settings():
     st.markdown("- **Analytics:** Help us improve user experience (if accepted)")
     st.markdown("- **No Tracking:** We do not use advertising or third-party tracking cookies")
 
+@st.fragment
 def show_rolling_sphere_header():
     """Show Rolling Sphere branding header"""
     # Center the logo and branding with logo inline with text
-    st.markdown("""
-    <div style='text-align: center; margin-bottom: 20px;'>
-        <div style='display: flex; align-items: center; justify-content: center; margin-bottom: 5px; margin-top: -10px;'>
-            <img src="data:image/png;base64,{}" style='width: 60px; height: 60px; margin-right: 15px;'>
-            <h1 style='color: #1f77b4; margin: 0; display: inline-block;'>Rolling Sphere</h1>
-        </div>
-        <h3 style='color: #666; margin-top: 5px;'>Hazardous Substances Compliance Center</h3>
-    </div>
-    """.format(get_logo_base64() if os.path.exists("assets/logo.png") else ""), unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
 
@@ -106,7 +817,7 @@ def show_auth_page():
     show_rolling_sphere_header()
     st.markdown("### Professional carbon footprint analysis for businesses")
     
-    auth = SimpleAuth()
+    auth = get_auth()
     
     # Create tabs for login and register
     tab1, tab2 = st.tabs(["Login", "Create Account"])
@@ -122,8 +833,7 @@ def show_dashboard():
     """Show user dashboard with calculation history"""
     show_rolling_sphere_header()
     
-    auth = SimpleAuth()
-    storage = DataStorage()
+    auth = get_auth()
     username = st.session_state.get('username', '')
     user_info = auth.get_current_user()
     
@@ -135,49 +845,59 @@ def show_dashboard():
         if st.button("Logout", type="secondary"):
             auth.logout()
     
-    # Get user's calculation history
-    calculations = storage.get_user_calculations(username, limit=5)
-    history_df = storage.get_calculation_history(username)
+    # Get user's calculation history (single cached fetch)
+    bundle = get_dashboard_bundle(username)
+    calculations = bundle['calculations']
+    history_df = bundle['history_df']
     
     if not history_df.empty:
-        st.subheader("📊 Your Emissions Trend")
-        
-        # Create trend chart
-        fig = px.line(
-            history_df, 
-            x='date', 
-            y='total_emissions',
-            title="CO2 Emissions Over Time",
-            labels={'total_emissions': 'CO2 Emissions (kg)', 'date': 'Date'}
-        )
-        fig.update_layout(showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Recent calculations summary
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Calculations", len(calculations))
-        with col2:
-            latest_emissions = history_df['total_emissions'].iloc[0] if len(history_df) > 0 else 0
-            st.metric("Latest Emissions", f"{latest_emissions:,.0f} kg")
-        with col3:
-            avg_emissions = history_df['total_emissions'].mean() if len(history_df) > 0 else 0
-            st.metric("Average Emissions", f"{avg_emissions:,.0f} kg")
+        # Fragment so button clicks elsewhere on the page don't rebuild the
+        # plotly figure and metrics
+        @st.fragment
+        def render_trend_section():
+            st.subheader("📊 Your Emissions Trend")
+
+            # Create trend chart (cached, WebGL-rendered). The stable key keeps
+            # the same client-side chart instance across reruns so Plotly
+            # diffs in place instead of destroying and re-mounting the plot
+            st.plotly_chart(build_trend_figure(history_df), use_container_width=True,
+                            key="emissions_trend")
+
+            # Recent calculations summary
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Calculations", len(calculations))
+            with col2:
+                st.metric("Latest Emissions", f"{bundle['latest_emissions']:,.0f} kg")
+            with col3:
+                st.metric("Average Emissions", f"{bundle['avg_emissions']:,.0f} kg")
+
+        render_trend_section()
     
     # Recent calculations table
     if calculations:
         st.subheader("📋 Recent Calculations")
         
-        recent_data = []
-        for calc in calculations[:5]:
-            recent_data.append({
-                "Date": calc["timestamp"][:10],
-                "Company": calc["company_info"].get("name", "Unknown"),
-                "Total CO2 (kg)": f"{calc['emissions_summary']['total_co2_kg']:,.0f}",
-                "Activities": calc["csv_row_count"]
-            })
-        
-        st.dataframe(pd.DataFrame(recent_data), use_container_width=True)
+        # Build the table in one vectorized pass instead of per-row dicts
+        recent_df = pd.json_normalize(calculations[:5])[
+            ['timestamp', 'company_info.name', 'emissions_summary.total_co2_kg', 'csv_row_count']
+        ]
+        recent_df['timestamp'] = recent_df['timestamp'].str.slice(0, 10)
+        recent_df['company_info.name'] = recent_df['company_info.name'].fillna("Unknown")
+        # Keep the emissions column numeric and let the grid format it
+        # client-side instead of interpolating strings in Python
+        recent_df['emissions_summary.total_co2_kg'] = recent_df['emissions_summary.total_co2_kg'].astype(float)
+        recent_df = recent_df.rename(columns={
+            'timestamp': 'Date',
+            'company_info.name': 'Company',
+            'emissions_summary.total_co2_kg': 'Total CO2 (kg)',
+            'csv_row_count': 'Activities'
+        })
+        st.dataframe(
+            recent_df,
+            use_container_width=True,
+            column_config={"Total CO2 (kg)": st.column_config.NumberColumn(format="%,.0f")}
+        )
     
     st.markdown("---")
     # Main action buttons
@@ -185,27 +905,15 @@ def show_dashboard():
     
     with col1:
         if st.button("📊 New Calculation", type="primary", use_container_width=True):
-            st.session_state.show_calculator = True
-            st.rerun()
+            _goto('show_calculator')
     
     with col2:
         if st.button("🔬 Hazardous Substances", type="secondary", use_container_width=True):
-            st.session_state.show_hazardous_substances = True
-            st.rerun()
+            _goto('show_hazardous_substances')
     
     # Disclaimer section
     st.markdown("---")
-    st.markdown("""
-    <div style='background-color: #fff3cd; border: 1px solid #ffc107; border-radius: 10px; padding: 20px; margin: 20px 0;'>
-        <h5 style='color: #856404; text-align: center; margin-bottom: 15px;'>⚠️ Disclaimer</h5>
-        <p style='color: #856404; text-align: center; margin: 0; font-size: 14px;'>
-            This platform provides automated analysis based on public regulatory data and user-provided information. 
-            It is intended for informational purposes only and does not constitute legal advice. The user is solely 
-            responsible for ensuring the accuracy of input data and for the final compliance of their products. 
-            Rolling Sphere Technologies assumes no liability for the use of this service.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(load_asset("disclaimer_dashboard.html"), unsafe_allow_html=True)
     
     # Privacy settings footer
     st.markdown("---")
@@ -214,8 +922,7 @@ def show_dashboard():
     col1, col2 = st.columns(2)
     with col1:
         if st.button("📞 Contact & Support", key="contact_footer", use_container_width=True):
-            st.session_state.show_contact = True
-            st.rerun()
+            _goto('show_contact')
     
     with col2:
         with st.expander("⚙️ Privacy & Cookie Settings"):
@@ -227,38 +934,23 @@ def show_dashboard():
             
             with col1_inner:
                 if st.button("View Privacy Policy", key="privacy_from_dashboard"):
-                    st.session_state.show_privacy = True
-                    st.rerun()
+                    _goto('show_privacy')
             
             with col2_inner:
                 if st.button("Contact & Support", key="contact_from_privacy"):
-                    st.session_state.show_contact = True
-                    st.rerun()
+                    _goto('show_contact')
 
 def show_hazardous_substances():
     """Show the hazardous substances compliance center - Professional redesign"""
     
     # STEP 1: Compact dark header with everything in one line
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 15px 20px; margin: -1rem -1rem 0 -1rem; border-radius: 0;'>
-        <div style='display: flex; justify-content: space-between; align-items: center;'>
-            <div style='display: flex; align-items: center;'>
-                <img src="data:image/png;base64,{}" style='width: 40px; height: 40px; margin-right: 12px;'>
-                <div>
-                    <h1 style='color: #1f77b4; margin: 0; font-size: 24px; font-weight: 600;'>Rolling Sphere</h1>
-                    <p style='color: #888; margin: 0; font-size: 14px;'>Hazardous Substances Compliance Center</p>
-                </div>
-            </div>
-        </div>
-    </div>
-    """.format(get_logo_base64() if os.path.exists("assets/logo.png") else ""), unsafe_allow_html=True)
+    st.markdown(_DARK_HEADER_HTML, unsafe_allow_html=True)
     
     # Dashboard button in top right corner
     col1, col2 = st.columns([5, 1])
     with col2:
         if st.button("← Dashboard", key="header_dashboard", use_container_width=True):
-            st.session_state.show_hazardous_substances = False
-            st.rerun()
+            _goto()
     
     # STEP 2 & 3: Professional cards side by side under header
     st.markdown("<div style='margin: 20px 0;'></div>", unsafe_allow_html=True)
@@ -267,25 +959,7 @@ def show_hazardous_substances():
     
     # Left Card: Start Compliance Analysis (blue theme)
     with col1:
-        st.markdown("""
-        <div style='
-            border: 2px solid #1f77b4; 
-            border-radius: 12px; 
-            padding: 25px; 
-            background: white; 
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-            height: 200px;
-            display: flex;
-            flex-direction: column;
-            justify-content: space-between;
-        '>
-            <div>
-                <div style='font-size: 36px; color: #1f77b4; margin-bottom: 10px;'>📤</div>
-                <h3 style='color: #333; margin: 0 0 10px 0; font-size: 20px; font-weight: 600;'>Start Compliance Analysis</h3>
-                <p style='color: #666; margin: 0; font-size: 14px; line-height: 1.4;'>Upload your material declaration and get instant regulatory compliance analysis for global markets.</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(load_asset("card_start_analysis.html"), unsafe_allow_html=True)
         
         if st.button("🚀 Start Analysis", key="start_analysis", type="primary", use_container_width=True):
             st.session_state.show_compliance_analysis = True
@@ -294,25 +968,7 @@ def show_hazardous_substances():
     
     # Right Card: Regulation Database (teal theme)
     with col2:
-        st.markdown("""
-        <div style='
-            border: 2px solid #20b2aa; 
-            border-radius: 12px; 
-            padding: 25px; 
-            background: white; 
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-            height: 200px;
-            display: flex;
-            flex-direction: column;
-            justify-content: space-between;
-        '>
-            <div>
-                <div style='font-size: 36px; color: #20b2aa; margin-bottom: 10px;'>🗄️</div>
-                <h3 style='color: #333; margin: 0 0 10px 0; font-size: 20px; font-weight: 600;'>Regulation Database</h3>
-                <p style='color: #666; margin: 0; font-size: 14px; line-height: 1.4;'>Browse our comprehensive database of 65 international regulations and standards.</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(load_asset("card_regulation_database.html"), unsafe_allow_html=True)
         
         if st.button("🔍 Browse Database", key="browse_database", use_container_width=True):
             st.session_state.show_all_regulations = True
@@ -322,39 +978,9 @@ def show_hazardous_substances():
     # STEP 4: Compact statistics in horizontal row
     st.markdown("<div style='margin: 20px 0;'></div>", unsafe_allow_html=True)
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #1f77b4, #4dabf7); border-radius: 8px; color: white; box-shadow: 0 2px 8px rgba(0,0,0,0.1);'>
-            <div style='font-size: 28px; font-weight: bold; margin-bottom: 5px;'>27</div>
-            <div style='font-size: 12px; opacity: 0.9;'>EU Regulations</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #28a745, #51cf66); border-radius: 8px; color: white; box-shadow: 0 2px 8px rgba(0,0,0,0.1);'>
-            <div style='font-size: 28px; font-weight: bold; margin-bottom: 5px;'>22</div>
-            <div style='font-size: 12px; opacity: 0.9;'>Asia-Pacific</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #ffc107, #ffed4e); border-radius: 8px; color: white; box-shadow: 0 2px 8px rgba(0,0,0,0.1);'>
-            <div style='font-size: 28px; font-weight: bold; margin-bottom: 5px;'>16</div>
-            <div style='font-size: 12px; opacity: 0.9;'>Other Regions</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #dc3545, #f783ac); border-radius: 8px; color: white; box-shadow: 0 2px 8px rgba(0,0,0,0.1);'>
-            <div style='font-size: 28px; font-weight: bold; margin-bottom: 5px;'>65</div>
-            <div style='font-size: 12px; opacity: 0.9;'>Total Standards</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # All four cards in a single CSS grid so Streamlit sends one element
+    # delta instead of four columns with a markdown block each
+    st.markdown(load_asset("stats_cards.html"), unsafe_allow_html=True)
     
     # Show compliance analysis workflow ONLY if requested (completely separate page)
     if st.session_state.get('show_compliance_analysis', False):
@@ -390,16 +1016,7 @@ def show_hazardous_substances():
                 help="Select your role in the supply chain"
             )
             
-            # Comprehensive country list
-            countries = [
-                "Germany", "USA", "China", "India", "Japan", "South Korea", "Singapore", 
-                "United Kingdom", "France", "Italy", "Netherlands", "Sweden", "Denmark",
-                "Canada", "Brazil", "Mexico", "Australia", "New Zealand", "South Africa",
-                "Thailand", "Malaysia", "Vietnam", "Philippines", "Indonesia", "Taiwan",
-                "Hong Kong", "Switzerland", "Austria", "Belgium", "Spain", "Poland",
-                "Czech Republic", "Hungary", "Romania", "Turkey", "Russia", "Other"
-            ]
-            company_location = st.selectbox("Company Location *", countries)
+            company_location = st.selectbox("Company Location *", _COUNTRIES)
             
         with col2:
             target_markets = st.multiselect(
@@ -416,97 +1033,6 @@ def show_hazardous_substances():
         st.markdown("---")
         st.markdown("### 📱 Product Information")
         
-        # Enhanced product categories with comprehensive cable types and subcategories
-        product_categories = {
-            "Computing & Telecommunications": [
-                "Smartphones", "Tablets", "Laptops", "Desktop Computers", "Servers", 
-                "Routers", "Switches", "Modems", "Network Equipment", "Data Storage Devices"
-            ],
-            "Consumer Electronics": [
-                "TVs", "Monitors", "Audio Systems", "Cameras", "Gaming Consoles", "Smart Home Devices",
-                "Wearables", "E-readers", "Streaming Devices", "Headphones", "Speakers"
-            ],
-            "Household Appliances": [
-                "Washing Machines", "Refrigerators", "Microwaves", "Dishwashers", "Air Conditioners",
-                "Vacuum Cleaners", "Coffee Machines", "Food Processors", "Electric Ovens", "Water Heaters"
-            ],
-            "Components & Accessories": [
-                "LED Cables", "USB Cables", "HDMI Cables", "Power Cables", "Network Cables", "Audio Cables",
-                "Adapters", "Batteries", "Circuit Boards", "Power Supplies", "Memory Cards", 
-                "USB Devices", "Chargers", "Connectors", "Electronic Components", "Computer Mouse", 
-                "Keyboards", "Webcams", "Microphones", "Headphones", "Other"
-            ],
-            "Industrial Equipment": [
-                "Control Systems", "Sensors", "Motors", "PLCs", "Industrial Computers",
-                "Measurement Devices", "Automation Equipment", "Power Electronics", "Drives", "HMI Panels"
-            ],
-            "Medical Devices": [
-                "Diagnostic Equipment", "Monitoring Devices", "Therapeutic Equipment", "Laboratory Equipment",
-                "Imaging Systems", "Patient Monitors", "Infusion Pumps", "Defibrillators", "Ventilators", "MRI Systems"
-            ]
-        }
-        
-        # Smart product recognition patterns
-        product_recognition_patterns = {
-            # Computing & Telecommunications
-            "Computing & Telecommunications": {
-                "keywords": ["smartphone", "phone", "iphone", "samsung galaxy", "laptop", "computer", "macbook", 
-                           "tablet", "ipad", "server", "router", "switch", "modem", "network"],
-                "types": {
-                    "smartphone|phone|iphone|samsung|galaxy": "Smartphones",
-                    "laptop|macbook|notebook": "Laptops", 
-                    "computer|desktop|pc": "Desktop Computers",
-                    "tablet|ipad": "Tablets",
-                    "server": "Servers",
-                    "router|switch|modem": "Network Equipment"
-                }
-            },
-            # Consumer Electronics  
-            "Consumer Electronics": {
-                "keywords": ["tv", "television", "monitor", "display", "audio", "speaker", "camera", "gaming", "console"],
-                "types": {
-                    "tv|television": "TVs",
-                    "monitor|display": "Monitors", 
-                    "audio|speaker|sound": "Audio Systems",
-                    "camera": "Cameras",
-                    "gaming|console|playstation|xbox": "Gaming Consoles"
-                }
-            },
-            # Household Appliances
-            "Household Appliances": {
-                "keywords": ["washing machine", "refrigerator", "fridge", "microwave", "dishwasher", "air conditioner"],
-                "types": {
-                    "washing machine|washer": "Washing Machines",
-                    "refrigerator|fridge": "Refrigerators",
-                    "microwave": "Microwaves",
-                    "dishwasher": "Dishwashers",
-                    "air conditioner|ac": "Air Conditioners"
-                }
-            },
-            # Components & Accessories
-            "Components & Accessories": {
-                "keywords": ["cable", "led cable", "usb cable", "hdmi cable", "power cable", "network cable", 
-                           "audio cable", "adapter", "battery", "charger", "connector", "mouse", "keyboard", "webcam", "microphone", "headphone"],
-                "types": {
-                    "led cable": "LED Cables",
-                    "usb cable": "USB Cables", 
-                    "hdmi cable": "HDMI Cables",
-                    "power cable": "Power Cables",
-                    "network cable": "Network Cables",
-                    "audio cable": "Audio Cables",
-                    "cable": "Cables",
-                    "adapter": "Adapters",
-                    "battery": "Batteries",
-                    "charger": "Chargers",
-                    "mouse": "Computer Mouse",
-                    "keyboard": "Keyboards",
-                    "webcam": "Webcams",
-                    "microphone|mic": "Microphones",
-                    "headphone|headset": "Headphones"
-                }
-            }
-        }
-        
         # Smart detection function with fallback
         def detect_product_category_and_type(description):
             """Auto-detect product category and type from description with smart fallbacks"""
@@ -514,28 +1040,29 @@ def show_hazardous_substances():
                 return None, None, None
                 
             desc_lower = description.lower()
-            
-            # First pass: Try exact keyword matching
-            for category, patterns in product_recognition_patterns.items():
-                for keyword in patterns["keywords"]:
-                    if keyword in desc_lower:
-                        # Find specific type
-                        detected_type = None
-                        for pattern, product_type in patterns["types"].items():
-                            import re
-                            if re.search(pattern, desc_lower):
-                                detected_type = product_type
-                                break
-                        
-                        return category, detected_type, f"Auto-detected: {keyword}"
-            
+
+            # First pass: one linear scan over the description instead of a
+            # substring check per keyword per category
+            keyword_match = _KEYWORD_SCAN_RE.search(desc_lower)
+            if keyword_match:
+                keyword = keyword_match.group(0)
+                category = _KEYWORD_CATEGORY[keyword]
+
+                # Find specific type
+                detected_type = None
+                for pattern_re, product_type in _COMPILED_PATTERNS[category]["types"]:
+                    if pattern_re.search(desc_lower):
+                        detected_type = product_type
+                        break
+
+                return category, detected_type, f"Auto-detected: {keyword}"
+
             # Second pass: Try partial word matching for fallback
-            import re
-            words_in_desc = re.findall(r'\b\w+\b', desc_lower)
-            
-            for category, patterns in product_recognition_patterns.items():
-                for pattern, product_type in patterns["types"].items():
-                    pattern_words = re.findall(r'\b\w+\b', pattern)
+            words_in_desc = _WORD_RE.findall(desc_lower)
+
+            for category, patterns in _COMPILED_PATTERNS.items():
+                for pattern_re, product_type in patterns["types"]:
+                    pattern_words = _WORD_RE.findall(pattern_re.pattern)
                     for pattern_word in pattern_words:
                         if pattern_word in words_in_desc:
                             return category, product_type, f"Partial match: {pattern_word}"
@@ -544,13 +1071,18 @@ def show_hazardous_substances():
             return "Components & Accessories", "Other", "Default category (unknown product type)"
         
         # Initialize session states for multiple products
-        if 'products_list' not in st.session_state:
-            st.session_state.products_list = [{'id': 0}]  # Start with one product
-        if 'product_counter' not in st.session_state:
-            st.session_state.product_counter = 1
+        st.session_state.setdefault('products_list', [{'id': 0}])  # Start with one product
+        st.session_state.setdefault('product_counter', 1)
+        st.session_state.setdefault('product_page', 0)
         
+        @st.fragment
         def render_product_form(product_index, product_data):
-            """Render a single product form with all detection logic"""
+            """Render a single product form with all detection logic.
+
+            Runs as a fragment so typing in one product's description only
+            reruns that form, not the whole page. The collected form values
+            are published to st.session_state for the enclosing page to read.
+            """
             product_id = product_data['id']
             
             # Initialize session states for this specific product
@@ -558,12 +1090,8 @@ def show_hazardous_substances():
             detected_type_key = f'detected_type_{product_id}'
             detection_msg_key = f'detection_message_{product_id}'
             
-            if detected_cat_key not in st.session_state:
-                st.session_state[detected_cat_key] = None
-            if detected_type_key not in st.session_state:
-                st.session_state[detected_type_key] = None
-            if detection_msg_key not in st.session_state:
-                st.session_state[detection_msg_key] = None
+            for key in (detected_cat_key, detected_type_key, detection_msg_key):
+                st.session_state.setdefault(key, None)
             
             # Product form header with remove button (for products after the first one)
             if product_index > 0:
@@ -573,7 +1101,7 @@ def show_hazardous_substances():
                 with col_header2:
                     if st.button("🗑️", key=f"remove_product_{product_id}", help="Remove this product"):
                         st.session_state.products_list.pop(product_index)
-                        st.rerun()
+                        st.rerun(scope="app")
             else:
                 st.markdown("#### Product Information")
             
@@ -589,28 +1117,39 @@ def show_hazardous_substances():
                     key=desc_key
                 )
                 
-                # Real-time smart detection
+                # Real-time smart detection - only rerun it when the text
+                # actually changed since the last processed value
+                last_desc_key = f'_last_desc_{product_id}'
                 if product_description:
-                    detected_cat, detected_type, message = detect_product_category_and_type(product_description)
-                    
-                    if detected_cat:
-                        # Update session state with new detection
-                        st.session_state[detected_cat_key] = detected_cat
-                        st.session_state[detected_type_key] = detected_type
-                        st.session_state[detection_msg_key] = message
-                        
-                        # Show detection feedback
-                        st.success(f"🎯 {message}")
-                    else:
-                        # Clear detection if no match found
-                        st.session_state[detected_cat_key] = None
-                        st.session_state[detected_type_key] = None
-                        st.session_state[detection_msg_key] = None
+                    if st.session_state.get(last_desc_key) != product_description:
+                        detected_cat, detected_type, message = detect_product_category_and_type(product_description)
+                        st.session_state[last_desc_key] = product_description
+
+                        if detected_cat:
+                            # Update session state with new detection
+                            st.session_state[detected_cat_key] = detected_cat
+                            st.session_state[detected_type_key] = detected_type
+                            st.session_state[detection_msg_key] = message
+                        else:
+                            # Clear detection if no match found
+                            st.session_state[detected_cat_key] = None
+                            st.session_state[detected_type_key] = None
+                            st.session_state[detection_msg_key] = None
+
+                    # Show detection feedback (cached or fresh)
+                    detection_message = st.session_state[detection_msg_key]
+                    if detection_message:
+                        st.success(f"🎯 {detection_message}")
             
             with col2:
+                # Snapshot the detection state once - each proxy read goes
+                # through SessionStateProxy lookup machinery
+                detected_category = st.session_state[detected_cat_key]
+                detected_type = st.session_state[detected_type_key]
+
                 # Smart category selection with auto-update
-                default_category = st.session_state[detected_cat_key] if st.session_state[detected_cat_key] else list(product_categories.keys())[0]
-                category_options = list(product_categories.keys()) + ["Custom Product"]
+                default_category = detected_category if detected_category else _CATEGORY_OPTIONS[0]
+                category_options = _CATEGORY_OPTIONS
                 
                 try:
                     default_index = category_options.index(default_category)
@@ -637,18 +1176,18 @@ def show_hazardous_substances():
             subcategory = None
             custom_details = None
             
-            if selected_category != "Custom Product" and selected_category in product_categories:
+            if selected_category != "Custom Product" and selected_category in _PRODUCT_CATEGORIES:
                 st.markdown("##### Product Type Selection")
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    type_options = product_categories[selected_category] + ["Other in this category"]
+                    type_options = _TYPE_OPTIONS[selected_category]
                     
                     # Set default type based on detection
                     default_type_index = 0
-                    if st.session_state[detected_type_key] and st.session_state[detected_type_key] in type_options:
+                    if detected_type and detected_type in type_options:
                         try:
-                            default_type_index = type_options.index(st.session_state[detected_type_key])
+                            default_type_index = type_options.index(detected_type)
                         except ValueError:
                             default_type_index = 0
                     
@@ -663,16 +1202,17 @@ def show_hazardous_substances():
                 with col2:
                     # Show related suggestions
                     st.markdown("**Smart Suggestions:**")
-                    if selected_category == "Components & Accessories" and product_description and "cable" in product_description.lower():
-                        cable_types = ["LED Cables", "USB Cables", "HDMI Cables", "Power Cables", "Network Cables", "Audio Cables"]
-                        for cable_type in cable_types:
-                            if cable_type.lower().replace(" cables", "") in product_description.lower():
+                    desc_lower = product_description.lower() if product_description else ""
+                    if selected_category == "Components & Accessories" and "cable" in desc_lower:
+                        matched = set(_CABLE_SUGGESTION_RE.findall(desc_lower))
+                        for keyword, cable_type in _CABLE_KEYWORDS.items():
+                            if keyword in matched:
                                 st.markdown(f"✅ {cable_type}")
                             else:
                                 st.markdown(f"• {cable_type}")
                     else:
                         # Show category-specific suggestions
-                        suggestions = product_categories.get(selected_category, [])[:4]
+                        suggestions = _CATEGORY_TOP_SUGGESTIONS.get(selected_category, ())
                         for suggestion in suggestions:
                             st.markdown(f"• {suggestion}")
             
@@ -684,155 +1224,125 @@ def show_hazardous_substances():
                     key=f"custom_details_{product_id}"
                 )
             
-            # Return product data
-            return {
+            # Publish product data for the enclosing page (fragment reruns
+            # cannot return values to the caller)
+            st.session_state[f'product_data_{product_id}'] = {
                 'description': product_description,
                 'category': selected_category,
                 'volume': production_volume,
                 'subcategory': subcategory,
                 'custom_details': custom_details
             }
-        
-        # Render all products
-        all_products_data = []
-        for i, product in enumerate(st.session_state.products_list):
-            if i > 0:
-                st.markdown("---")  # Add separator between products
-            
-            product_data = render_product_form(i, product)
-            all_products_data.append(product_data)
+
+        # Only the current page of product forms builds widgets, so reruns
+        # stay flat as the product count grows. Off-page products keep the
+        # values published the last time their form was rendered
+        products_list = st.session_state.products_list
+        total_pages = (len(products_list) + _PRODUCT_PAGE_SIZE - 1) // _PRODUCT_PAGE_SIZE
+        page = min(st.session_state.product_page, total_pages - 1)
+        st.session_state.product_page = page
+        page_start = page * _PRODUCT_PAGE_SIZE
+        page_end = min(page_start + _PRODUCT_PAGE_SIZE, len(products_list))
+
+        if total_pages > 1:
+            nav_prev, nav_info, nav_next = st.columns([1, 2, 1])
+            with nav_prev:
+                if st.button("⬅️ Previous", key="product_page_prev", disabled=page == 0):
+                    st.session_state.product_page = page - 1
+                    st.rerun()
+            with nav_info:
+                st.markdown(f"**Products {page_start + 1}-{page_end} of {len(products_list)}**")
+            with nav_next:
+                if st.button("Next ➡️", key="product_page_next", disabled=page >= total_pages - 1):
+                    st.session_state.product_page = page + 1
+                    st.rerun()
+
+        # Collected values use a column-per-field layout so the validation
+        # and category passes below run over flat lists instead of one
+        # dict per product
+        products = {'description': [], 'category': [], 'volume': [],
+                    'subcategory': [], 'custom_details': []}
+        for i, product in enumerate(products_list):
+            if page_start <= i < page_end:
+                if i > page_start:
+                    st.markdown("---")  # Add separator between products
+                render_product_form(i, product)
+
+            product_data = st.session_state.get(f"product_data_{product['id']}", {
+                'description': '', 'category': '', 'volume': '',
+                'subcategory': None, 'custom_details': None
+            })
+            for field, values in products.items():
+                values.append(product_data[field])
             
             # Add the "Add Another Product" button right after each product form
-            if i == len(st.session_state.products_list) - 1:  # Only show after the last product
+            if i == len(products_list) - 1:  # Only show after the last product
                 st.markdown("")  # Small space
                 col1, col2, col3 = st.columns([1, 1, 1])
                 with col2:
                     if st.button("➕ Add Another Product", key="add_product_btn", type="secondary", help="Add another product to your compliance report"):
                         new_product = {'id': st.session_state.product_counter}
-                        st.session_state.products_list.append(new_product)
+                        products_list.append(new_product)
                         st.session_state.product_counter += 1
+                        # Jump to the page holding the new form
+                        st.session_state.product_page = (len(products_list) - 1) // _PRODUCT_PAGE_SIZE
                         st.rerun()
         
+        descriptions = products['description']
+        categories = products['category']
+
+        # Single pass over the collected products - the regulations preview,
+        # the form validation, and the analysis section below all reuse
+        # these instead of re-deriving them
+        valid_indices = [i for i, (desc, cat) in enumerate(zip(descriptions, categories))
+                         if desc and cat]
+        all_categories = {categories[i] for i in valid_indices}
+        products_complete = bool(descriptions) and len(valid_indices) == len(descriptions)
+
         # Get data from first product for backward compatibility
-        if all_products_data:
-            product_description = all_products_data[0]['description']
-            selected_category = all_products_data[0]['category']
-            production_volume = all_products_data[0]['volume']
-            subcategory = all_products_data[0]['subcategory']
+        if descriptions:
+            product_description = descriptions[0]
+            selected_category = categories[0]
+            production_volume = products['volume'][0]
+            subcategory = products['subcategory'][0]
         else:
             product_description = ""
             selected_category = ""
             production_volume = ""
             subcategory = ""
         
-        # Smart regulation selection logic
-        def get_applicable_regulations(role, location, markets, category):
-            """Determine applicable regulations based on business context - UNIVERSAL for ALL locations"""
-            applicable_regs = []
-            
-            # UNIVERSAL MANUFACTURING LOCATION REGULATIONS
-            # EU Countries (Germany, France, Italy, Netherlands, Belgium, Spain, etc.)
-            eu_countries = ["Germany", "France", "Italy", "Netherlands", "Belgium", "Spain", "Austria", "Portugal", "Finland", "Denmark", "Sweden", "Poland", "Czech Republic", "Hungary", "Slovakia", "Slovenia", "Croatia", "Romania", "Bulgaria", "Lithuania", "Latvia", "Estonia", "Luxembourg", "Cyprus", "Malta", "Ireland", "Greece"]
-            
-            if location in eu_countries:
-                applicable_regs.extend(["RoHS Directive", "REACH", "WEEE Directive", "EMC Directive", "Packaging Directive", "Radio Equipment Directive"])
-            elif location == "China":
-                applicable_regs.extend(["China RoHS", "CCC Certification", "GB Standards", "China Manufacturing Standards"])
-            elif location == "India":
-                applicable_regs.extend(["India E-Waste Rules", "BIS Standards", "Environment Protection Act", "Pollution Control Act"])
-            elif location in ["United States", "USA"]:
-                applicable_regs.extend(["EPA Regulations", "OSHA Standards", "FCC Manufacturing", "State Environmental Laws"])
-            elif location in ["Japan", "South Korea", "Singapore", "Taiwan"]:
-                applicable_regs.extend(["WEEE Equivalent", "Chemical Safety Standards", "Manufacturing Safety"])
-            else:
-                # Generic regulations for any other manufacturing location
-                applicable_regs.extend(["International Standards", "Local Environmental Laws", "Safety Standards"])
-            
-            # UNIVERSAL TARGET MARKET REGULATIONS
-            for market in markets:
-                if "United States" in market or "USA" in market:
-                    applicable_regs.extend(["California Proposition 65", "TSCA", "FCC Regulations", "CPSIA"])
-                    if category == "Computing & Telecommunications":
-                        applicable_regs.append("FCC Part 15")
-                
-                elif "China" in market:
-                    applicable_regs.extend(["China RoHS", "CCC Certification", "GB Standards", "China WEEE"])
-                    if category == "Computing & Telecommunications":
-                        applicable_regs.extend(["CCC for IT Equipment", "SRRC Approval"])
-                    if category == "Medical Devices":
-                        applicable_regs.append("NMPA Registration")
-                
-                elif "India" in market:
-                    applicable_regs.extend(["India E-Waste Rules", "BIS Standards", "Environment Protection Act", "Hazardous Waste Rules"])
-                    if category == "Computing & Telecommunications":
-                        applicable_regs.extend(["BIS Registration", "WPC Approval", "TEC Approval"])
-                    if category == "Medical Devices":
-                        applicable_regs.append("CDSCO Registration")
-                
-                elif "European Union" in market and location not in eu_countries:
-                    applicable_regs.extend(["RoHS Directive", "REACH", "WEEE Directive", "CE Marking"])
-                    if category == "Medical Devices":
-                        applicable_regs.append("Medical Device Regulation")
-                    if category == "Computing & Telecommunications":
-                        applicable_regs.extend(["Radio Equipment Directive", "EMC Directive"])
-                
-                elif "Japan" in market:
-                    applicable_regs.extend(["Japan RoHS", "Japan WEEE", "PSE Certification", "VCCI Standards"])
-                    if category == "Computing & Telecommunications":
-                        applicable_regs.append("MIC Type Approval")
-                
-                elif "South Korea" in market:
-                    applicable_regs.extend(["Korea RoHS", "K-REACH", "WEEE Korea", "KC Certification"])
-                    if category == "Computing & Telecommunications":
-                        applicable_regs.append("KCC Approval")
-                
-                elif "Global Market" in market:
-                    applicable_regs.extend(["IEC Standards", "ISO Environmental", "Global Best Practices", "International Trade Requirements"])
-                
-                else:
-                    # Generic regulations for any other target market
-                    applicable_regs.extend([f"{market} Market Entry Requirements", f"{market} Safety Standards", f"{market} Environmental Compliance"])
-            
-            # Remove duplicates while preserving order
-            return list(dict.fromkeys(applicable_regs))
-        
         # Show applicable regulations preview for all products
-        if business_role and company_location and target_markets and all_products_data:
-            # Collect all unique categories from all products
-            all_categories = set()
-            valid_products = []
-            for product in all_products_data:
-                if product['description'] and product['category']:
-                    all_categories.add(product['category'])
-                    valid_products.append(product)
-            
-            if all_categories and valid_products:
+        if business_role and company_location and target_markets and descriptions:
+            if all_categories:
                 # Get regulations for all categories
                 all_applicable = set()
                 for category in all_categories:
-                    regs = get_applicable_regulations(business_role, company_location, target_markets, category)
+                    regs = get_applicable_regulations(business_role, company_location, tuple(sorted(target_markets)), category)
                     all_applicable.update(regs)
                 
                 applicable = list(all_applicable)
                 
                 st.markdown("---")
                 st.markdown("### 📋 Applicable Regulations Preview")
-                if len(valid_products) > 1:
-                    st.info(f"**{len(applicable)} regulations** identified for {len(valid_products)} products across {len(all_categories)} categories:")
+                if len(valid_indices) > 1:
+                    st.info(f"**{len(applicable)} regulations** identified for {len(valid_indices)} products across {len(all_categories)} categories:")
                     
                     # Show products summary
                     st.markdown("**Products included:**")
-                    for i, product in enumerate(valid_products):
-                        st.markdown(f"• **Product {i+1}:** {product['description']} ({product['category']})")
+                    for i, idx in enumerate(valid_indices):
+                        st.markdown(f"• **Product {i+1}:** {descriptions[idx]} ({categories[idx]})")
                 else:
                     st.info(f"**{len(applicable)} regulations** identified based on your context:")
                 
-                # Show regulations
+                # Show regulations - one markdown element per column
+                # instead of one per regulation
                 if applicable:
-                    cols = st.columns(min(3, len(applicable)))
+                    num_cols = min(3, len(applicable))
+                    col_texts = [""] * num_cols
                     for i, reg in enumerate(applicable[:6]):  # Show first 6
-                        with cols[i % 3]:
-                            st.markdown(f"• {reg}")
+                        col_texts[i % num_cols] += f"• {reg}\n\n"
+                    for col, text in zip(st.columns(num_cols), col_texts):
+                        col.markdown(text)
                     if len(applicable) > 6:
                         st.markdown(f"... and {len(applicable) - 6} more")
         
@@ -852,11 +1362,8 @@ def show_hazardous_substances():
             st.markdown("**Need a template?**")
             
             # Load template file for download
-            template_path = "templates/rolling_sphere_template.xlsx"
-            if os.path.exists(template_path):
-                with open(template_path, "rb") as template_file:
-                    template_data = template_file.read()
-                    
+            template_data = get_material_template_bytes()
+            if template_data is not None:
                 st.download_button(
                     label="📥 Download Template",
                     data=template_data,
@@ -875,38 +1382,29 @@ def show_hazardous_substances():
             st.markdown("- Supplier information")
         
         # Form validation for all products
-        products_complete = all([
-            product['description'] and product['category'] 
-            for product in all_products_data
-        ])
-        
-        form_complete = all([
+        form_complete = all((
             business_role,
-            company_location, 
+            company_location,
             target_markets,
             products_complete,
-            len(all_products_data) > 0
-        ])
+        ))
         
         if not form_complete:
             st.warning("⚠️ Please complete all required fields (*) before uploading files")
         elif uploaded_file is None:
             st.info("📤 Ready to upload - Please select your material declaration file")
         
-        if uploaded_file is not None and form_complete:
+        # Fragment: report clicks and preview toggles rerun only this section,
+        # and product-form edits elsewhere don't re-parse the upload
+        @st.fragment
+        def run_analysis_section():
             # Professional loading state
             with st.spinner("🔄 Analyzing material declaration..."):
                 try:
                     # Process the uploaded file with enhanced support
-                    file_extension = uploaded_file.name.split('.')[-1].lower()
-                    
-                    if file_extension == 'csv':
-                        # Read CSV file
-                        df = pd.read_csv(uploaded_file)
-                    elif file_extension in ['xlsx', 'xls']:
-                        # Read Excel file with openpyxl
-                        df = pd.read_excel(uploaded_file, engine='openpyxl' if file_extension == 'xlsx' else 'xlrd')
-                    else:
+                    # (cached - repeat reruns skip the parse)
+                    df = parse_material_upload(uploaded_file.name, uploaded_file.getvalue())
+                    if df is None:
                         st.error("❌ Unsupported file format. Please use CSV (.csv) or Excel (.xlsx, .xls) files.")
                         return
                     
@@ -916,37 +1414,33 @@ def show_hazardous_substances():
                         return
                     
                     st.success("✅ File processed successfully!")
-                    
+
+                    # Applicable regulations across every product category,
+                    # computed once and shared by the report button and the
+                    # results section below (valid_indices/all_categories come
+                    # from the single pass in the enclosing page)
+                    markets_key = tuple(sorted(target_markets))
+                    all_applicable_regs = set()
+                    for category in all_categories:
+                        all_applicable_regs.update(
+                            get_applicable_regulations(business_role, company_location, markets_key, category)
+                        )
+                    applicable_regs = list(all_applicable_regs)
+
                     # Generate compliance report button - moved here to be under the success message
                     if st.button("📄 Generate Detailed Compliance Report", type="primary"):
-                        # Get applicable regulations for all product categories
-                        all_categories = set()
-                        valid_products = []
-                        for product in all_products_data:
-                            if product['description'] and product['category']:
-                                all_categories.add(product['category'])
-                                valid_products.append(product)
-                        
-                        # Collect regulations for all categories
-                        all_applicable_regs = set()
-                        for category in all_categories:
-                            regs = get_applicable_regulations(business_role, company_location, target_markets, category)
-                            all_applicable_regs.update(regs)
-                        applicable_regs = list(all_applicable_regs)
-                        
                         with st.spinner("🔄 Generating comprehensive compliance report..."):
                             try:
                                 # Initialize PDF report generator
-                                report_generator = ComplianceReportGenerator()
+                                report_generator = get_report_generator()
                                 
-                                # Run compliance analysis
-                                compliance_engine = ComplianceEngine()
-                                analysis = compliance_engine.analyze_file_compliance(df, applicable_regs)
+                                # Run compliance analysis (memoized)
+                                analysis = run_compliance_analysis(df, tuple(applicable_regs))
                                 
                                 # Prepare multiple products data for report
                                 products_summary = []
-                                for i, product in enumerate(valid_products):
-                                    products_summary.append(f"Product {i+1}: {product['description']} ({product['category']})")
+                                for i, idx in enumerate(valid_indices):
+                                    products_summary.append(f"Product {i+1}: {descriptions[idx]} ({categories[idx]})")
                                 
                                 # Prepare data for report
                                 business_context = {
@@ -958,18 +1452,15 @@ def show_hazardous_substances():
                                 }
                                 
                                 # Use first product for main product info, but include count
-                                main_product = valid_products[0] if valid_products else all_products_data[0]
+                                main = valid_indices[0] if valid_indices else 0
                                 product_info = {
-                                    'description': main_product['description'] + (f" (+ {len(valid_products)-1} more products)" if len(valid_products) > 1 else ""),
-                                    'category': main_product['category'],
-                                    'type': main_product['subcategory'] or main_product['category'],
-                                    'volume': main_product['volume'],
-                                    'total_products': len(valid_products)
+                                    'description': descriptions[main] + (f" (+ {len(valid_indices)-1} more products)" if len(valid_indices) > 1 else ""),
+                                    'category': categories[main],
+                                    'type': products['subcategory'][main] or categories[main],
+                                    'volume': products['volume'][main],
+                                    'total_products': len(valid_indices)
                                 }
                                 
-                                # Convert DataFrame to list of dictionaries for report
-                                materials_list = df.to_dict('records') if not df.empty else []
-                                
                                 # Prepare regulations data
                                 regulations_data = [{'name': reg, 'authority': 'Government Authority', 'status': 'Active', 'priority': 'Standard'} for reg in applicable_regs]
                                 
@@ -984,7 +1475,7 @@ def show_hazardous_substances():
                                 filename, filepath = report_generator.generate_compliance_report(
                                     business_context=business_context,
                                     product_info=product_info,
-                                    materials_data=materials_list,
+                                    materials_data=df,
                                     applicable_regulations=regulations_data,
                                     analysis_results=analysis_summary
                                 )
@@ -1012,9 +1503,6 @@ def show_hazardous_substances():
                         st.dataframe(df.head(10), use_container_width=True)
                         st.info(f"File contains {len(df)} rows and {len(df.columns)} columns")
                     
-                    # Get applicable regulations for this specific context
-                    applicable_regs = get_applicable_regulations(business_role, company_location, target_markets, selected_category)
-                    
                     st.markdown("---")
                     st.markdown("### 📊 Compliance Analysis Results")
                     
@@ -1033,8 +1521,8 @@ def show_hazardous_substances():
                     st.markdown("---")
                     
                     # Run enhanced compliance analysis with applicable regulations
-                    compliance_engine = ComplianceEngine()
-                    analysis = compliance_engine.analyze_file_compliance(df, applicable_regs)
+                    # (memoized - shared with the report branch above)
+                    analysis = run_compliance_analysis(df, tuple(applicable_regs))
                     
                     # Enhanced results display
                     col1, col2, col3, col4 = st.columns(4)
@@ -1071,7 +1559,10 @@ def show_hazardous_substances():
                     
                 except Exception as e:
                     st.error(f"❌ Error processing file: {str(e)}")
-        
+
+        if uploaded_file is not None and form_complete:
+            run_analysis_section()
+
         # Back to main button
         st.markdown("---")
         if st.button("← Back to Overview", key="back_compliance_analysis"):
@@ -1088,7 +1579,7 @@ def show_hazardous_substances():
         st.markdown("Browse and search our complete international regulatory database with official government sources.")
         
         # Initialize database
-        regulatory_db = RegulatoryDatabase()
+        regulatory_db = get_regulatory_database()
         all_regulations = regulatory_db.get_all_regulations()
         
         # Search and filter functionality
@@ -1102,24 +1593,42 @@ def show_hazardous_substances():
             region_filter = st.selectbox("Filter by Region", 
                                        ["All Regions", "European Union", "Asia-Pacific", "Other Regions"])
         
-        # Apply filters
-        filtered_regulations = all_regulations
-        
-        if search_term:
-            filtered_regulations = [reg for reg in filtered_regulations 
-                                  if search_term.lower() in reg.name.lower() 
-                                  or search_term.lower() in reg.scope.lower()
-                                  or search_term.lower() in reg.authority.lower()]
-        
-        if region_filter != "All Regions":
-            filtered_regulations = [reg for reg in filtered_regulations if reg.region == region_filter]
-        
-        st.info(f"Showing {len(filtered_regulations)} of {len(all_regulations)} regulations")
+        # Apply filters. Without a search term the cached region partition
+        # already is the answer; otherwise run a single pass over the
+        # precomputed lowercase index
+        search_lower = search_term.lower() if search_term else ""
+        if not search_lower:
+            by_region, _ = get_regulation_partition()
+
+            def region_bucket(region):
+                if region_filter in ("All Regions", region):
+                    return by_region.get(region, [])
+                return []
+
+            eu_regs = region_bucket("European Union")
+            apac_regs = region_bucket("Asia-Pacific")
+            other_regs = region_bucket("Other Regions")
+            filtered_count = len(eu_regs) + len(apac_regs) + len(other_regs)
+        else:
+            eu_regs = []
+            apac_regs = []
+            other_regs = []
+            region_buckets = {"European Union": eu_regs, "Asia-Pacific": apac_regs,
+                              "Other Regions": other_regs}
+            filtered_count = 0
+            for reg, name_lower, scope_lower, authority_lower in get_regulation_search_index():
+                if not (search_lower in name_lower
+                        or search_lower in scope_lower
+                        or search_lower in authority_lower):
+                    continue
+                if region_filter != "All Regions" and reg.region != region_filter:
+                    continue
+                filtered_count += 1
+                bucket = region_buckets.get(reg.region)
+                if bucket is not None:
+                    bucket.append(reg)
         
-        # Group regulations by region
-        eu_regs = [reg for reg in filtered_regulations if reg.region == "European Union"]
-        apac_regs = [reg for reg in filtered_regulations if reg.region == "Asia-Pacific"]
-        other_regs = [reg for reg in filtered_regulations if reg.region == "Other Regions"]
+        st.info(f"Showing {filtered_count} of {len(all_regulations)} regulations")
         
         # Display EU Regulations
         if eu_regs:
@@ -1185,17 +1694,17 @@ def show_hazardous_substances():
                     st.markdown(f"**Scope:** {reg.scope}")
                     st.markdown(f"**Requirements:** {reg.requirements_summary}")
         
-        # Summary statistics
+        # Summary statistics (counts precomputed in one cached pass)
+        total_regulations, region_counts, verified_count = get_regulation_stats()
         st.markdown("### Database Statistics")
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Regulations", len(all_regulations))
+            st.metric("Total Regulations", total_regulations)
         with col2:
-            st.metric("EU Regulations", len([r for r in all_regulations if r.region == "European Union"]))
+            st.metric("EU Regulations", region_counts["European Union"])
         with col3:
-            st.metric("Asia-Pacific", len([r for r in all_regulations if r.region == "Asia-Pacific"]))
+            st.metric("Asia-Pacific", region_counts["Asia-Pacific"])
         with col4:
-            verified_count = len([r for r in all_regulations if "✅ Verified" in r.verification_status])
             st.metric("Verified Sources", verified_count)
         
         if st.button("← Back to Main", key="back_all_regulations"):
@@ -1204,17 +1713,7 @@ def show_hazardous_substances():
     
     # Disclaimer section for hazardous substances
     st.markdown("---")
-    st.markdown("""
-    <div style='background-color: #fff3cd; border: 1px solid #ffc107; border-radius: 10px; padding: 20px; margin: 20px 0;'>
-        <h5 style='color: #856404; text-align: center; margin-bottom: 15px;'>⚠️ Regulatory Compliance Disclaimer</h5>
-        <p style='color: #856404; text-align: center; margin: 0; font-size: 14px;'>
-            This compliance analysis is based on publicly available regulatory data and automated processing. 
-            Results are for informational purposes only and do not constitute legal compliance certification. 
-            Users must verify results with qualified legal counsel and regulatory authorities. Rolling Sphere 
-            Technologies is not liable for compliance decisions based on this analysis.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(load_asset("disclaimer_compliance.html"), unsafe_allow_html=True)
     
     # Navigation footer
     st.markdown("---")
@@ -1224,20 +1723,15 @@ def show_hazardous_substances():
     
     with nav_col1:
         if st.button("📞 Contact & About", use_container_width=True):
-            st.session_state.show_hazardous_substances = False
-            st.session_state.show_contact = True
-            st.rerun()
+            _goto('show_contact')
     
     with nav_col2:
         if st.button("🔒 Privacy Policy", use_container_width=True):
-            st.session_state.show_hazardous_substances = False
-            st.session_state.show_privacy = True
-            st.rerun()
+            _goto('show_privacy')
     
     with nav_col3:
         if st.button("← Back to Dashboard", type="secondary", use_container_width=True):
-            st.session_state.show_hazardous_substances = False
-            st.rerun()
+            _goto()
 
 def show_contact():
     """Show contact information page for Rolling Sphere Technologies"""
@@ -1247,8 +1741,7 @@ def show_contact():
     col1, col2 = st.columns([1, 6])
     with col1:
         if st.button("← Back to Platform"):
-            st.session_state.show_contact = False
-            st.rerun()
+            _goto()
     with col2:
         st.markdown("<h2 style='color: #333; margin-top: 0;'>Contact Information</h2>", unsafe_allow_html=True)
     
@@ -1264,8 +1757,9 @@ def show_contact():
     """, unsafe_allow_html=True)
     
     # Contact details
-    st.markdown("### 📧 Contact Details")
     st.markdown("""
+    ### 📧 Contact Details
+
     **Location:** Bucharest, Romania  
     **Email:** rollingsphere.project@gmail.com  
     **Business Hours:** Monday - Friday: 9:00 - 17:00 EET  
@@ -1280,8 +1774,7 @@ def show_privacy():
     col1, col2 = st.columns([1, 6])
     with col1:
         if st.button("← Dashboard"):
-            st.session_state.show_privacy = False
-            st.rerun()
+            _goto()
     with col2:
         st.markdown("<h2 style='color: #333; margin-top: 0;'>Privacy Policy</h2>", unsafe_allow_html=True)
     
@@ -1295,133 +1788,16 @@ def show_privacy():
     </div>
     """, unsafe_allow_html=True)
     
-    # Main privacy policy content
-    st.markdown("### 1. Data Controller")
-    st.markdown("""
-    **Rolling Sphere Technologies**  
-    Location: Bucharest, Romania  
-    Email: rollingsphere.project@gmail.com  
-    EU Member State: Romania
-    """)
-    
-    st.markdown("### 2. Data We Collect")
-    
-    st.markdown("#### 2.1 Material Declaration Data")
-    st.markdown("""
-    - Component names and descriptions
-    - Substance concentration data (ppm values)
-    - Supplier information and locations
-    - Product specifications and categories
-    """)
-    
-    st.markdown("#### 2.2 Business Context Information")
-    st.markdown("""
-    - Company role (Producer, Importer, Distributor, Recycler)
-    - Target markets (EU, USA, Asia-Pacific, etc.)
-    - Product categories (Computing, Electronics, etc.)
-    - Company location and business context
-    """)
-    
-    st.markdown("#### 2.3 Technical Data")
-    st.markdown("""
-    - IP address (for security and fraud prevention)
-    - Browser type and version
-    - Usage timestamps and session data
-    - File upload metadata
-    """)
-    
-    st.markdown("### 3. Legal Basis for Processing (GDPR Art. 6)")
-    st.markdown("""
-    - **Legitimate Interest (Art. 6.1.f):** Providing regulatory compliance analysis services
-    - **Contract Performance (Art. 6.1.b):** Delivering compliance reports and analysis
-    - **Legal Obligation (Art. 6.1.c):** Meeting regulatory compliance requirements
-    - **Consent (Art. 6.1.a):** Where explicitly provided for additional services
-    """)
-    
-    st.markdown("### 4. How We Use Your Data")
-    st.markdown("""
-    - Analyze uploaded material declarations against 65+ international regulations
-    - Generate professional compliance reports with official source citations
-    - Provide regulatory recommendations based on business context
-    - Apply relevant regulations based on target markets and company role
-    - Improve our compliance analysis algorithms (anonymized data only)
-    """)
-    
-    st.markdown("### 5. Data Retention")
-    st.markdown("""
-    - **Uploaded Files:** Deleted immediately after processing (within 24 hours)
-    - **Analysis Results:** Stored for 30 days for report download access
-    - **Generated Reports:** Available for download for 30 days
-    - **Technical Logs:** Retained for 90 days for security and fraud prevention
-    - **Anonymized Statistics:** Retained indefinitely for service improvement
-    """)
-    
-    st.markdown("### 6. Data Sharing and Third Parties")
-    st.markdown("We do **NOT** share your confidential material declaration data with third parties. Limited sharing includes:")
-    st.markdown("""
-    - **Service Providers:** Replit (hosting), with appropriate data processing agreements
-    - **Legal Requirements:** When required by Romanian or EU law
-    - **Anonymized Research:** Aggregated, non-identifiable statistics for regulatory research
-    """)
-    
-    st.markdown("### 7. Your GDPR Rights")
-    st.markdown("As a data subject in the EU, you have the following rights:")
-    st.markdown("""
-    - **Right of Access (Art. 15):** Request copies of your personal data
-    - **Right to Rectification (Art. 16):** Correct inaccurate or incomplete data
-    - **Right to Erasure (Art. 17):** Request deletion of your data
-    - **Right to Restrict Processing (Art. 18):** Limit how we process your data
-    - **Right to Data Portability (Art. 20):** Transfer your data to another service
-    - **Right to Object (Art. 21):** Object to processing based on legitimate interests
-    - **Right to Withdraw Consent:** Where processing is based on consent
-    """)
+    # Main privacy policy content - the static sections are batched into
+    # two markdown calls around the callout below
+    st.markdown(load_asset("privacy_policy_1.md"))
     
     st.info("""
     **To exercise these rights:** Contact rollingsphere.project@gmail.com  
     **Response time:** Within 30 days as required by GDPR
     """)
     
-    st.markdown("### 8. Data Security")
-    st.markdown("""
-    - HTTPS/TLS encryption for all data transmission
-    - Secure cloud infrastructure with access controls
-    - Regular security updates and vulnerability monitoring
-    - Authentication and authorization controls
-    - Data minimization and purpose limitation principles
-    """)
-    
-    st.markdown("### 9. International Data Transfers")
-    st.markdown("Your data may be processed on servers outside Romania/EU. We ensure adequate protection through:")
-    st.markdown("""
-    - Standard Contractual Clauses (SCCs) approved by European Commission
-    - Adequacy decisions by the European Commission
-    - Appropriate safeguards under GDPR Art. 46
-    - Regular assessment of third-country data protection levels
-    """)
-    
-    st.markdown("### 10. Data Protection Authority")
-    st.markdown("""
-    **Romanian Supervisory Authority:**  
-    Autoritatea Națională de Supraveghere a Prelucrării Datelor cu Caracter Personal (ANSPDCP)  
-    Website: www.dataprotection.ro  
-    
-    You have the right to lodge a complaint with ANSPDCP or your local EU data protection authority.
-    """)
-    
-    st.markdown("### 11. Contact Information")
-    st.markdown("""
-    **Data Protection Officer:** rollingsphere.project@gmail.com  
-    **General Contact:** rollingsphere.project@gmail.com  
-    **Address:** Bucharest, Romania  
-    **Response Time:** Within 24-48 hours for general inquiries, 30 days for GDPR requests
-    """)
-    
-    st.markdown("### 12. Changes to This Policy")
-    st.markdown("""
-    We may update this privacy policy to reflect changes in our practices or legal requirements. 
-    Material changes will be communicated via email or platform notification. The "Last updated" 
-    date indicates the most recent revision.
-    """)
+    st.markdown(load_asset("privacy_policy_2.md"))
     
     # Action buttons
     st.markdown("---")
@@ -1429,14 +1805,11 @@ def show_privacy():
     
     with col1:
         if st.button("← Back to Platform", type="primary"):
-            st.session_state.show_privacy = False
-            st.rerun()
+            _goto()
     
     with col2:
         if st.button("📞 Contact Us"):
-            st.session_state.show_privacy = False
-            st.session_state.show_contact = True
-            st.rerun()
+            _goto('show_contact')
     
     with col3:
         if st.button("⚙️ Cookie Settings"):
@@ -1448,57 +1821,40 @@ def main():
     # Show cookie banner first (before authentication)
     show_cookie_banner()
     
-    auth = SimpleAuth()
+    auth = get_auth()
     
     # Initialize session state
-    if 'calculated_data' not in st.session_state:
-        st.session_state.calculated_data = None
-    if 'company_info' not in st.session_state:
-        st.session_state.company_info = {}
-    if 'show_calculator' not in st.session_state:
-        st.session_state.show_calculator = False
-    if 'show_hazardous_substances' not in st.session_state:
-        st.session_state.show_hazardous_substances = False
-    if 'show_compliance_analysis' not in st.session_state:
-        st.session_state.show_compliance_analysis = False
-    if 'show_all_regulations' not in st.session_state:
-        st.session_state.show_all_regulations = False
-    if 'show_contact' not in st.session_state:
-        st.session_state.show_contact = False
-    if 'show_privacy' not in st.session_state:
-        st.session_state.show_privacy = False
+    for key, default in _SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = default() if callable(default) else default
     
     # Check authentication
     if not auth.is_authenticated():
         show_auth_page()
         return
     
-    # Show appropriate page based on session state
-    if st.session_state.show_calculator:
-        show_calculator()
-    elif st.session_state.show_hazardous_substances:
-        show_hazardous_substances()
-    elif st.session_state.show_contact:
-        show_contact()
-    elif st.session_state.show_privacy:
-        show_privacy()
-    else:
-        show_dashboard()
+    # Route to the first page whose flag is set; the dashboard is the default
+    for flag, page in (('show_calculator', show_calculator),
+                       ('show_hazardous_substances', show_hazardous_substances),
+                       ('show_contact', show_contact),
+                       ('show_privacy', show_privacy)):
+        if st.session_state[flag]:
+            page()
+            return
+    show_dashboard()
 
 def show_calculator():
     """Show the main calculator interface"""
     show_rolling_sphere_header()
     
-    auth = SimpleAuth()
-    storage = DataStorage()
+    storage = get_storage()
     username = st.session_state.get('username', '')
     
     # Header with back button
     col1, col2 = st.columns([1, 6])
     with col1:
         if st.button("← Dashboard"):
-            st.session_state.show_calculator = False
-            st.rerun()
+            _goto()
     with col2:
         st.markdown("<h2 style='color: #333; margin-top: 0;'>Calculate Your Carbon Footprint</h2>", unsafe_allow_html=True)
     
@@ -1519,12 +1875,9 @@ def show_calculator():
         
         st.markdown("---")
         
-        # Use the user's original template
-        template_path = "templates/Rolling_Sphere_Complete_CO2_Template_1755947979815.xlsx"
-        if os.path.exists(template_path):
-            with open(template_path, "rb") as template_file:
-                excel_bytes = template_file.read()
-        else:
+        # Use the user's original template (bytes cached across reruns)
+        excel_bytes = get_co2_template_bytes()
+        if excel_bytes is None:
             st.error("Template file not found. Please contact support.")
             excel_bytes = b''
         
@@ -1552,37 +1905,19 @@ def show_calculator():
         
         if uploaded_file is not None:
             try:
-                # Read and validate data
-                if uploaded_file.name.endswith('.csv'):
-                    df = pd.read_csv(uploaded_file)
-                else:
-                    # Handle Excel files - read all data and extract properly
-                    try:
-                        # Try pandas first (simpler approach)
-                        excel_data = pd.read_excel(uploaded_file, header=None)
-                        
-                        # Extract data rows (skip SCOPE headers and column headers)
-                        data_rows = []
-                        headers = ['company_name', 'activity_type', 'category', 'amount', 'unit', 'date']
-                        
-                        for index, row in excel_data.iterrows():
-                            if (pd.notna(row.iloc[0]) and str(row.iloc[0]).strip() and 
-                                'SCOPE' not in str(row.iloc[0]) and 
-                                str(row.iloc[0]).strip() != 'company_name'):
-                                # Clean the row data
-                                clean_row = [str(row.iloc[i]) if pd.notna(row.iloc[i]) else '' for i in range(min(6, len(row)))]
-                                if len(clean_row) >= 4 and clean_row[1]:  # Must have activity_type
-                                    data_rows.append(clean_row)
-                        
-                        # Convert to DataFrame
-                        df = pd.DataFrame(data_rows, columns=headers)
-                    except Exception as e:
-                        st.error(f"Error reading Excel file: {str(e)}")
-                        df = pd.DataFrame()
+                # Snapshot the upload once; parse_emissions_upload
+                # dispatches on the extension and is cached on the bytes,
+                # so reruns never re-read or re-decode the stream
+                file_bytes = uploaded_file.getvalue()
+                try:
+                    df = parse_emissions_upload(uploaded_file.name, file_bytes)
+                except Exception as e:
+                    st.error(f"Error reading file: {str(e)}")
+                    df = pd.DataFrame()
                 
-                validator = DataValidator()
+                data_valid, validation_errors = validate_emissions_data(df)
                 
-                if validator.validate_data(df):
+                if data_valid:
                     st.success("File uploaded successfully")
                     
                     # Generate PDF Report button - moved here to be under the success message
@@ -1590,6 +1925,7 @@ def show_calculator():
                         if st.session_state.calculated_data and company_name:
                             try:
                                 with st.spinner("Generating PDF report..."):
+                                    from utils.pdf_generator import PDFGenerator
                                     pdf_generator = PDFGenerator()
                                     pdf_buffer = pdf_generator.generate_report(
                                         st.session_state.calculated_data,
@@ -1622,370 +1958,248 @@ def show_calculator():
                     with st.expander("View Uploaded Data", expanded=False):
                         st.dataframe(df)
                     
-                    # Calculate emissions
-                    calculator = EmissionsCalculator()
-                    results = calculator.calculate_emissions(df)
+                    # Calculate emissions (memoized per unique upload)
+                    results = compute_emissions(df)
                     
                     if results:
-                        st.session_state.calculated_data = results
+                        # Fragment: interactions inside the results
+                        # panel (e.g. saving the calculation) rerun
+                        # only this section, not the whole page
+                        @st.fragment
+                        def render_results_panel():
+                            st.session_state.calculated_data = results
                         
-                        # Display summary metrics
-                        st.subheader("📈 Emissions Summary")
+                            # Bind the hottest Streamlit calls once per
+                            # rerun instead of an attribute lookup per call
+                            metric, markdown = st.metric, st.markdown
+                            caption, columns = st.caption, st.columns
                         
-                        total_emissions = results['summary']['total_co2_kg']
-                        col_metric1, col_metric2, col_metric3 = st.columns(3)
+                            # Display summary metrics
+                            st.subheader("📈 Emissions Summary")
                         
-                        with col_metric1:
-                            st.metric(
-                                "Total CO2 Emissions", 
-                                f"{total_emissions:,.2f} kg",
-                                help="Total carbon dioxide equivalent emissions"
-                            )
+                            total_emissions = results['summary']['total_co2_kg']
+                            col_metric1, col_metric2, col_metric3 = columns(3)
                         
-                        with col_metric2:
-                            st.metric(
-                                "CO2 per Activity", 
-                                f"{total_emissions / len(results['detailed_results']):.2f} kg",
-                                help="Average emissions per recorded activity"
-                            )
-                        
-                        with col_metric3:
-                            emissions_tons = total_emissions / 1000
-                            st.metric(
-                                "Total (Tonnes)", 
-                                f"{emissions_tons:.2f} t",
-                                help="Total emissions in tonnes"
-                            )
+                            with col_metric1:
+                                metric(
+                                    "Total CO2 Emissions", 
+                                    f"{total_emissions:,.2f} kg",
+                                    help="Total carbon dioxide equivalent emissions"
+                                )
                         
-                        # ===== NEW: EXECUTIVE DASHBOARD =====
-                        st.markdown("---")
-                        st.subheader("🎯 Executive Dashboard")
+                            with col_metric2:
+                                metric(
+                                    "CO2 per Activity", 
+                                    f"{total_emissions / len(results['detailed_results']):.2f} kg",
+                                    help="Average emissions per recorded activity"
+                                )
                         
-                        # Get scope data for executive summary
-                        scope_data = results['by_scope']
-                        scope1_kg = scope_data['scope_1']['total_kg']
-                        scope2_kg = scope_data['scope_2']['total_kg']
-                        scope3_kg = scope_data['scope_3']['total_kg']
+                            with col_metric3:
+                                emissions_tons = total_emissions / 1000
+                                metric(
+                                    "Total (Tonnes)", 
+                                    f"{emissions_tons:.2f} t",
+                                    help="Total emissions in tonnes"
+                                )
                         
-                        scope1_percent = (scope1_kg / total_emissions * 100) if total_emissions > 0 else 0
-                        scope2_percent = (scope2_kg / total_emissions * 100) if total_emissions > 0 else 0
-                        scope3_percent = (scope3_kg / total_emissions * 100) if total_emissions > 0 else 0
+                            # ===== NEW: EXECUTIVE DASHBOARD =====
+                            markdown("---")
+                            st.subheader("🎯 Executive Dashboard")
                         
-                        # Determine overall status
-                        combined_scope13 = scope1_percent + scope3_percent
-                        if combined_scope13 > 80:
-                            overall_status = "🔴 ACTION REQUIRED"
-                            status_color = "#ff4444"
-                        elif combined_scope13 > 60:
-                            overall_status = "🟡 ATTENTION NEEDED"
-                            status_color = "#ff8800"
-                        else:
-                            overall_status = "🟢 GOOD PERFORMANCE"
-                            status_color = "#00aa00"
+                            # Scope totals, tonnes, and percentages computed once
+                            # and shared by the executive summary, the scope
+                            # analysis, and the recommendations sections
+                            scope_data = results['by_scope']
+                            scope_activities = {
+                                scope_num: scope_data[f'scope_{scope_num}']['activities']
+                                for scope_num in (1, 2, 3)
+                            }
+                            scope_stats = {}
+                            for scope_num in (1, 2, 3):
+                                kg = scope_data[f'scope_{scope_num}']['total_kg']
+                                scope_stats[scope_num] = (
+                                    kg, kg / 1000,
+                                    (kg / total_emissions * 100) if total_emissions > 0 else 0
+                                )
+                            scope1_kg, scope1_tonnes, scope1_percent = scope_stats[1]
+                            scope2_kg, scope2_tonnes, scope2_percent = scope_stats[2]
+                            scope3_kg, scope3_tonnes, scope3_percent = scope_stats[3]
                         
-                        # Visual executive summary box
-                        st.markdown(f"""
-                        <div style='background: linear-gradient(135deg, #f0f8ff, #e6f3ff); border: 2px solid #1f77b4; border-radius: 15px; padding: 20px; margin: 20px 0;'>
-                            <div style='text-align: center; margin-bottom: 15px;'>
-                                <h2 style='color: #1f77b4; margin: 0;'>📊 EXECUTIVE SUMMARY</h2>
-                            </div>
-                            <div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; align-items: center;'>
-                                <div style='text-align: center; padding: 10px;'>
-                                    <h3 style='color: #333; margin: 5px;'>Total Emissions</h3>
-                                    <h1 style='color: #1f77b4; margin: 5px; font-size: 2.2em;'>{emissions_tons:.2f}</h1>
-                                    <p style='color: #666; margin: 0;'>tonnes CO2e</p>
-                                </div>
-                                <div style='text-align: center;'>
-                                    <div style='background: #ff4444; color: white; padding: 8px 12px; border-radius: 8px; margin: 3px;'>
-                                        <strong>SCOPE 1: {scope1_kg/1000:.2f}t ({scope1_percent:.1f}%) - RED</strong>
-                                    </div>
-                                    <div style='background: #00aa00; color: white; padding: 8px 12px; border-radius: 8px; margin: 3px;'>
-                                        <strong>SCOPE 2: {scope2_kg/1000:.2f}t ({scope2_percent:.1f}%) - GREEN</strong>
-                                    </div>
-                                    <div style='background: #ff8800; color: white; padding: 8px 12px; border-radius: 8px; margin: 3px;'>
-                                        <strong>SCOPE 3: {scope3_kg/1000:.2f}t ({scope3_percent:.1f}%) - ORANGE</strong>
-                                    </div>
-                                </div>
-                                <div style='text-align: center; padding: 10px;'>
-                                    <h3 style='color: {status_color}; margin: 5px;'>Overall Status</h3>
-                                    <h2 style='color: {status_color}; margin: 5px; font-size: 1.4em;'>{overall_status}</h2>
-                                    <p style='color: #666; margin: 0; font-size: 12px;'>{'Scope 1+3 > 80% requires action' if combined_scope13 > 80 else 'Performance acceptable'}</p>
-                                </div>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                            # Determine overall status from the threshold table
+                            combined_scope13 = scope1_percent + scope3_percent
+                            overall_status, status_color, status_note = next(
+                                level for bound, level in _STATUS_LEVELS
+                                if combined_scope13 <= bound
+                            )
                         
+                            # Visual executive summary box - rebuilt only when the totals
+                            # actually change; other reruns reuse the cached string
+                            exec_key = hash((total_emissions, scope1_kg, scope2_kg, scope3_kg))
+                            if st.session_state.get('_exec_summary_key') != exec_key:
+                                st.session_state._exec_summary_html = _EXEC_SUMMARY_TEMPLATE.substitute(
+                                    emissions_tons=f"{emissions_tons:.2f}",
+                                    scope1_tonnes=f"{scope1_tonnes:.2f}",
+                                    scope1_percent=f"{scope1_percent:.1f}",
+                                    scope2_tonnes=f"{scope2_tonnes:.2f}",
+                                    scope2_percent=f"{scope2_percent:.1f}",
+                                    scope3_tonnes=f"{scope3_tonnes:.2f}",
+                                    scope3_percent=f"{scope3_percent:.1f}",
+                                    status_color=status_color,
+                                    overall_status=overall_status,
+                                    status_note=status_note,
+                                )
+                                st.session_state._exec_summary_key = exec_key
+                            markdown(st.session_state._exec_summary_html, unsafe_allow_html=True)
                         
-                        st.markdown("---")
                         
-                        # GHG Protocol Scope Analysis
-                        st.subheader("🌍 GHG Protocol Scope Analysis")
+                            markdown("---")
                         
-                        scope_data = results['by_scope']
-                        col_scope1, col_scope2, col_scope3 = st.columns(3)
+                            # GHG Protocol Scope Analysis
+                            st.subheader("🌍 GHG Protocol Scope Analysis")
                         
-                        with col_scope1:
-                            scope1_kg = scope_data['scope_1']['total_kg']
-                            scope1_tonnes = scope1_kg / 1000
-                            scope1_percent = (scope1_kg / total_emissions * 100) if total_emissions > 0 else 0
-                            
-                            st.metric(
-                                "SCOPE 1 (Direct)", 
-                                f"{scope1_kg:,.2f} kg",
-                                delta=f"{scope1_percent:.1f}% of total",
-                                help="Direct emissions from owned/controlled sources"
+                            # One loop over the three scopes replaces the
+                            # copy-pasted per-column blocks
+                            scope_metric_config = (
+                                (1, "SCOPE 1 (Direct)", "Direct emissions from owned/controlled sources", None),
+                                (2, "SCOPE 2 (Energy)", "Indirect emissions from purchased energy", None),
+                                (3, "SCOPE 3 (Indirect)", "Other indirect emissions from value chain", 3),
                             )
-                            st.caption(f"**{scope1_tonnes:.2f} tonnes CO2e**")
-                            if scope_data['scope_1']['activities']:
-                                st.caption(f"Activities: {', '.join([act.replace('_', ' ').title() for act in scope_data['scope_1']['activities']])}")
+                            for col, (scope_num, label, help_text, max_shown) in zip(columns(3), scope_metric_config):
+                                kg, tonnes, percent = scope_stats[scope_num]
+                                with col:
+                                    metric(
+                                        label,
+                                        f"{kg:,.2f} kg",
+                                        delta=f"{percent:.1f}% of total",
+                                        help=help_text
+                                    )
+                                    caption(f"**{tonnes:.2f} tonnes CO2e**")
+                                    activities = scope_activities[scope_num]
+                                    if activities:
+                                        caption(f"Activities: {format_activities(activities, max_shown)}")
                         
-                        with col_scope2:
-                            scope2_kg = scope_data['scope_2']['total_kg']
-                            scope2_tonnes = scope2_kg / 1000
-                            scope2_percent = (scope2_kg / total_emissions * 100) if total_emissions > 0 else 0
-                            
-                            st.metric(
-                                "SCOPE 2 (Energy)", 
-                                f"{scope2_kg:,.2f} kg",
-                                delta=f"{scope2_percent:.1f}% of total",
-                                help="Indirect emissions from purchased energy"
-                            )
-                            st.caption(f"**{scope2_tonnes:.2f} tonnes CO2e**")
-                            if scope_data['scope_2']['activities']:
-                                st.caption(f"Activities: {', '.join([act.replace('_', ' ').title() for act in scope_data['scope_2']['activities']])}")
+                            # ===== NEW: SPECIFIC SCOPE RECOMMENDATIONS =====
+                            markdown("---")
+                            st.subheader("💡 Scope-Specific Recommendations")
                         
-                        with col_scope3:
-                            scope3_kg = scope_data['scope_3']['total_kg']
-                            scope3_tonnes = scope3_kg / 1000
-                            scope3_percent = (scope3_kg / total_emissions * 100) if total_emissions > 0 else 0
-                            
-                            st.metric(
-                                "SCOPE 3 (Indirect)", 
-                                f"{scope3_kg:,.2f} kg",
-                                delta=f"{scope3_percent:.1f}% of total",
-                                help="Other indirect emissions from value chain"
+                            # One CSS grid holding all three cards: a single
+                            # element delta instead of three columns with a
+                            # markdown block each
+                            cards = []
+                            for scope_num in (1, 2, 3):
+                                kg = scope_stats[scope_num][0]
+                                tonnes = scope_stats[scope_num][1]
+                                color, background, icon, kind, advice, empty_kind = _SCOPE_CARD_STYLES[scope_num]
+                                if kg > 0:
+                                    acts = scope_activities[scope_num]
+                                    acts_text = format_activities(acts, 5 if scope_num == 3 else None) if acts else 'None identified'
+                                    cards.append(_SCOPE_CARD_TEMPLATE.format(
+                                        color=color, background=background, icon=icon,
+                                        num=scope_num, tonnes=tonnes, kind=kind,
+                                        activities=acts_text, advice=advice,
+                                    ))
+                                else:
+                                    cards.append(_SCOPE_EMPTY_TEMPLATE.format(num=scope_num, kind=empty_kind))
+                            markdown(
+                                "<div style='display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 15px;'>"
+                                + ''.join(cards) + "</div>",
+                                unsafe_allow_html=True
                             )
-                            st.caption(f"**{scope3_tonnes:.2f} tonnes CO2e**")
-                            if scope_data['scope_3']['activities']:
-                                activities_text = ', '.join([act.replace('_', ' ').title() for act in scope_data['scope_3']['activities'][:3]])
-                                if len(scope_data['scope_3']['activities']) > 3:
-                                    activities_text += f" +{len(scope_data['scope_3']['activities'])-3} more"
-                                st.caption(f"Activities: {activities_text}")
                         
-                        # ===== NEW: SPECIFIC SCOPE RECOMMENDATIONS =====
-                        st.markdown("---")
-                        st.subheader("💡 Scope-Specific Recommendations")
+                            # ===== METHODOLOGY & STANDARDS =====
+                            markdown("---")
+                            st.subheader("📋 Calculation Methodology")
                         
-                        col_rec1, col_rec2, col_rec3 = st.columns(3)
+                            markdown(_METHODOLOGY_HTML, unsafe_allow_html=True)
                         
-                        with col_rec1:
-                            # Only show recommendations if there are Scope 1 emissions
-                            if scope1_kg > 0:
-                                scope1_activities_text = ', '.join([act.replace('_', ' ').title() for act in scope_data['scope_1']['activities']]) if scope_data['scope_1']['activities'] else 'None identified'
-                                st.markdown(f"""
-                                <div style='border-left: 4px solid #ff4444; padding: 15px; background: #fff5f5; border-radius: 8px;'>
-                                    <h5 style='color: #ff4444; margin: 0 0 10px 0;'>🔴 SCOPE 1 ({scope1_kg/1000:.2f}t)</h5>
-                                    <p style='margin: 5px 0; font-size: 14px; color: #333;'><strong>Direct emissions from: {scope1_activities_text}</strong></p>
-                                    <p style='margin: 10px 0; font-size: 12px; color: #666;'>Consider energy efficiency improvements and equipment upgrades for these activities.</p>
-                                </div>
-                                """, unsafe_allow_html=True)
-                            else:
-                                st.markdown("""
-                                <div style='border-left: 4px solid #00aa00; padding: 15px; background: #f5fff5; border-radius: 8px;'>
-                                    <h5 style='color: #00aa00; margin: 0 0 10px 0;'>✅ SCOPE 1 (0.0t)</h5>
-                                    <p style='margin: 5px 0; font-size: 14px; color: #333;'><strong>No direct emissions detected</strong></p>
-                                </div>
-                                """, unsafe_allow_html=True)
+                            # Visualizations
+                            st.subheader("📊 Emissions Breakdown")
                         
-                        with col_rec2:
-                            if scope2_kg > 0:
-                                scope2_activities_text = ', '.join([act.replace('_', ' ').title() for act in scope_data['scope_2']['activities']]) if scope_data['scope_2']['activities'] else 'None identified'
-                                st.markdown(f"""
-                                <div style='border-left: 4px solid #00aa00; padding: 15px; background: #f5fff5; border-radius: 8px;'>
-                                    <h5 style='color: #00aa00; margin: 0 0 10px 0;'>🟢 SCOPE 2 ({scope2_kg/1000:.2f}t)</h5>
-                                    <p style='margin: 5px 0; font-size: 14px; color: #333;'><strong>Energy emissions from: {scope2_activities_text}</strong></p>
-                                    <p style='margin: 10px 0; font-size: 12px; color: #666;'>Consider renewable energy sources and energy efficiency measures.</p>
-                                </div>
-                                """, unsafe_allow_html=True)
-                            else:
-                                st.markdown("""
-                                <div style='border-left: 4px solid #00aa00; padding: 15px; background: #f5fff5; border-radius: 8px;'>
-                                    <h5 style='color: #00aa00; margin: 0 0 10px 0;'>✅ SCOPE 2 (0.0t)</h5>
-                                    <p style='margin: 5px 0; font-size: 14px; color: #333;'><strong>No energy emissions detected</strong></p>
-                                </div>
-                                """, unsafe_allow_html=True)
-                        
-                        with col_rec3:
-                            if scope3_kg > 0:
-                                scope3_activities_text = ', '.join([act.replace('_', ' ').title() for act in scope_data['scope_3']['activities'][:5]]) if scope_data['scope_3']['activities'] else 'None identified'
-                                if len(scope_data['scope_3']['activities']) > 5:
-                                    scope3_activities_text += f' +{len(scope_data["scope_3"]["activities"])-5} more'
-                                st.markdown(f"""
-                                <div style='border-left: 4px solid #ff8800; padding: 15px; background: #fff8f0; border-radius: 8px;'>
-                                    <h5 style='color: #ff8800; margin: 0 0 10px 0;'>🟠 SCOPE 3 ({scope3_kg/1000:.2f}t)</h5>
-                                    <p style='margin: 5px 0; font-size: 14px; color: #333;'><strong>Indirect emissions from: {scope3_activities_text}</strong></p>
-                                    <p style='margin: 10px 0; font-size: 12px; color: #666;'>Consider supply chain optimization and process improvements for these activities.</p>
-                                </div>
-                                """, unsafe_allow_html=True)
-                            else:
-                                st.markdown("""
-                                <div style='border-left: 4px solid #00aa00; padding: 15px; background: #f5fff5; border-radius: 8px;'>
-                                    <h5 style='color: #00aa00; margin: 0 0 10px 0;'>✅ SCOPE 3 (0.0t)</h5>
-                                    <p style='margin: 5px 0; font-size: 14px; color: #333;'><strong>No indirect emissions detected</strong></p>
-                                </div>
-                                """, unsafe_allow_html=True)
-                        
-                        # ===== METHODOLOGY & STANDARDS =====
-                        st.markdown("---")
-                        st.subheader("📋 Calculation Methodology")
-                        
-                        st.markdown("""
-                        <div style='background: #f0f8ff; border: 1px solid #1f77b4; border-radius: 10px; padding: 20px; margin: 15px 0;'>
-                            <h4 style='color: #1f77b4; margin-bottom: 15px;'>📊 Data Sources & Standards</h4>
-                            <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 15px;'>
-                                <div style='display: flex; align-items: center;'><span style='color: #00aa00; font-size: 18px;'>✓</span> <strong style='margin-left: 8px;'>UK Government GHG Conversion Factors 2023</strong></div>
-                                <div style='display: flex; align-items: center;'><span style='color: #00aa00; font-size: 18px;'>✓</span> <strong style='margin-left: 8px;'>EPA Emission Factors for GHG Inventories</strong></div>
-                                <div style='display: flex; align-items: center;'><span style='color: #00aa00; font-size: 18px;'>✓</span> <strong style='margin-left: 8px;'>IPCC Guidelines for National GHG Inventories</strong></div>
-                                <div style='display: flex; align-items: center;'><span style='color: #00aa00; font-size: 18px;'>✓</span> <strong style='margin-left: 8px;'>GHG Protocol Scope Classification</strong></div>
-                            </div>
-                            <p style='color: #666; font-size: 12px; margin-top: 15px; text-align: center;'>All emission factors sourced from official government and international standards</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Visualizations
-                        st.subheader("📊 Emissions Breakdown")
-                        
-                        # Visual Analysis section
-                        st.markdown("### Visual Analysis")
-                        
-                        # Pie chart by activity type with improved labels
-                        activity_names = [name.replace('_', ' ').title() for name in results['by_activity'].keys()]
-                        fig_pie = px.pie(
-                            values=list(results['by_activity'].values()),
-                            names=activity_names,
-                            title="Emissions by Activity Type"
-                        )
-                        # Improve label positioning to avoid overlap
-                        fig_pie.update_traces(
-                            textposition='outside',
-                            textinfo='percent+label',
-                            pull=[0.05] * len(activity_names)  # Slightly separate slices
-                        )
-                        fig_pie.update_layout(
-                            showlegend=True,
-                            legend=dict(
-                                orientation="v",
-                                yanchor="middle",
-                                y=0.5,
-                                xanchor="left",
-                                x=1.01
-                            ),
-                            margin=dict(l=20, r=120, t=50, b=20)
-                        )
-                        st.plotly_chart(fig_pie, use_container_width=True)
+                            # Visual Analysis section
+                            markdown("### Visual Analysis")
                         
-                        # Bar chart by category with improved formatting
-                        if results['by_category']:
-                            category_names = [name.replace('_', ' ').title() for name in results['by_category'].keys()]
-                            fig_bar = px.bar(
-                                x=category_names,
-                                y=list(results['by_category'].values()),
-                                title="Emissions by Category",
-                                labels={'x': 'Category', 'y': 'CO2 Emissions (kg)'}
-                            )
-                            # Rotate x-axis labels to prevent overlap
-                            fig_bar.update_layout(
-                                xaxis_tickangle=-45,
-                                margin=dict(b=100)
-                            )
-                            st.plotly_chart(fig_bar, use_container_width=True)
+                            # Charts are cached on the aggregated data, so reruns
+                            # with an unchanged calculation skip figure construction
+                            fig_pie = build_activity_pie(tuple(results['by_activity'].items()))
+                            st.plotly_chart(fig_pie, use_container_width=True, key="emissions_pie")
                         
-                        # Time series if dates are available
-                        if 'monthly_emissions' in results and results['monthly_emissions']:
-                            fig_line = px.line(
-                                x=list(results['monthly_emissions'].keys()),
-                                y=list(results['monthly_emissions'].values()),
-                                title="Monthly Emissions Trend",
-                                labels={'x': 'Month', 'y': 'CO2 Emissions (kg)'}
-                            )
-                            st.plotly_chart(fig_line, use_container_width=True)
+                            # Bar chart by category with improved formatting
+                            if results['by_category']:
+                                fig_bar = build_category_bar(tuple(results['by_category'].items()))
+                                st.plotly_chart(fig_bar, use_container_width=True, key="emissions_bar")
                         
-                        # Save calculation to user's history
-                        if st.button("💾 Save This Calculation", type="secondary"):
-                            try:
-                                calc_id = storage.save_calculation(username, st.session_state.company_info, results, df)
-                                st.success(f"✅ Calculation saved! (ID: {calc_id})")
-                            except Exception as e:
-                                st.error(f"Error saving calculation: {str(e)}")
+                            # Time series if dates are available
+                            if 'monthly_emissions' in results and results['monthly_emissions']:
+                                fig_line = build_monthly_line(tuple(results['monthly_emissions'].items()))
+                                st.plotly_chart(fig_line, use_container_width=True, key="emissions_line")
                         
-                        # Detailed breakdown table
-                        with st.expander("Detailed Emissions Breakdown"):
-                            detailed_df = pd.DataFrame(results['detailed_results'])
-                            st.dataframe(detailed_df)
+                            # Save calculation to user's history
+                            if st.button("💾 Save This Calculation", type="secondary"):
+                                try:
+                                    calc_id = storage.save_calculation(username, st.session_state.company_info, results, df)
+                                    st.success(f"✅ Calculation saved! (ID: {calc_id})")
+                                except Exception as e:
+                                    st.error(f"Error saving calculation: {str(e)}")
                         
-                        # ===== NEW: ENHANCED ACTIONABLE RECOMMENDATIONS =====
-                        st.markdown("---")
-                        st.subheader("🎯 Specific Action Recommendations")
+                            # Detailed breakdown table - the expander body runs
+                            # whether or not it is open, so the DataFrame is
+                            # rebuilt only when the calculation changes. Keyed
+                            # on the calculation timestamp, not the totals
+                            # hash: a re-upload that only corrects dates keeps
+                            # the totals identical but is a new calculation
+                            detail_key = results['summary']['calculation_date']
+                            with st.expander("Detailed Emissions Breakdown"):
+                                if st.session_state.get('_detail_df_key') != detail_key:
+                                    st.session_state._detail_df = pd.DataFrame(results['detailed_results'])
+                                    st.session_state._detail_df_key = detail_key
+                                st.dataframe(st.session_state._detail_df)
                         
-                        st.markdown("""
-                        <div style='background: #f8f9fa; border: 1px solid #dee2e6; border-radius: 10px; padding: 20px; margin: 15px 0;'>
-                            <h4 style='color: #333; margin-bottom: 15px;'>💰 High-Impact Actions with Savings Potential</h4>
-                        """, unsafe_allow_html=True)
+                            # ===== NEW: ENHANCED ACTIONABLE RECOMMENDATIONS =====
+                            markdown("---")
+                            st.subheader("🎯 Specific Action Recommendations")
                         
-                        # Generate recommendations based on actual calculated data
-                        high_impact_recs = []
+                            markdown("""
+                            <div style='background: #f8f9fa; border: 1px solid #dee2e6; border-radius: 10px; padding: 20px; margin: 15px 0;'>
+                                <h4 style='color: #333; margin-bottom: 15px;'>💰 High-Impact Actions with Savings Potential</h4>
+                            """, unsafe_allow_html=True)
                         
-                        # Find the highest emission activity types and provide relevant recommendations
-                        if results.get('by_activity'):
-                            # Sort activities by emissions (highest first)
-                            sorted_activities = sorted(results['by_activity'].items(), key=lambda x: x[1], reverse=True)
-                            
-                            for activity_type, emissions_kg in sorted_activities[:3]:  # Top 3 activities
-                                activity_name = activity_type.replace('_', ' ').title()
-                                emissions_tonnes = emissions_kg / 1000
-                                high_impact_recs.append(f"**Focus on {activity_name}** - Currently {emissions_tonnes:.2f} tonnes CO2e ({(emissions_kg/total_emissions)*100:.1f}% of total)")
+                            # Generate recommendations based on actual calculated data
+                            high_impact_recs = []
                         
-                        # Display recommendations based on actual data
-                        for i, rec in enumerate(high_impact_recs, 1):
-                            st.markdown(f"**{i}.** {rec}")
+                            # Find the highest emission activity types and provide relevant recommendations
+                            if results.get('by_activity'):
+                                # Top 3 activities without sorting the whole tail
+                                for activity_type, emissions_kg in nlargest(3, results['by_activity'].items(), key=itemgetter(1)):
+                                    activity_name = _pretty_label(activity_type)
+                                    emissions_tonnes = emissions_kg / 1000
+                                    high_impact_recs.append(f"**Focus on {activity_name}** - Currently {emissions_tonnes:.2f} tonnes CO2e ({(emissions_kg/total_emissions)*100:.1f}% of total)")
                         
-                        if not high_impact_recs:
-                            st.markdown("*Recommendations will appear based on your emissions data.*")
+                            # Display recommendations based on actual data
+                            for i, rec in enumerate(high_impact_recs, 1):
+                                markdown(f"**{i}.** {rec}")
                         
-                        st.markdown("</div>", unsafe_allow_html=True)
+                            if not high_impact_recs:
+                                markdown("*Recommendations will appear based on your emissions data.*")
                         
-                        # ===== NEW: PROFESSIONAL FOOTER WITH CONFIDENTIALITY =====
-                        st.markdown("---")
-                        from datetime import datetime
-                        current_date = datetime.now()
-                        valid_until = current_date.replace(year=current_date.year + 1)
+                            markdown("</div>", unsafe_allow_html=True)
                         
-                        st.markdown(f"""
-                        <div style='background: linear-gradient(135deg, #1f77b4, #4dabf7); color: white; border-radius: 10px; padding: 20px; margin: 20px 0; text-align: center;'>
-                            <div style='font-size: 18px; font-weight: bold; margin-bottom: 10px;'>🏢 Rolling Sphere Technologies - CO2 Analysis Report</div>
-                            <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-top: 15px;'>
-                                <div>
-                                    <div style='font-size: 14px; opacity: 0.9;'>Report Generated:</div>
-                                    <div style='font-weight: bold;'>{current_date.strftime('%Y-%m-%d %H:%M')}</div>
-                                </div>
-                                <div>
-                                    <div style='font-size: 14px; opacity: 0.9;'>Contact:</div>
-                                    <div style='font-weight: bold;'>rollingsphere.project@gmail.com</div>
-                                </div>
-                            </div>
-                            <div style='margin-top: 15px; font-size: 12px; opacity: 0.8;'>
-                                Professional Environmental Analysis | Official Emission Factor Sources
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                            # ===== NEW: PROFESSIONAL FOOTER WITH CONFIDENTIALITY =====
+                            markdown("---")
+                            markdown(_FOOTER_TEMPLATE.format_map(
+                                {'date': datetime.now().strftime('%Y-%m-%d %H:%M')}
+                            ), unsafe_allow_html=True)
                     
+                        render_results_panel()
                     else:
                         st.error("❌ Error calculating emissions. Please check your data format.")
                 
                 else:
-                    st.error("❌ Data validation failed. Please check the required columns and data format.")
-                    for error in validator.get_errors():
-                        st.error(f"• {error}")
+                    # One element for the whole list instead of an st.error
+                    # round-trip per message
+                    st.error(
+                        "❌ Data validation failed. Please check the required columns and data format.\n\n"
+                        + "\n".join(f"- {error}" for error in validation_errors)
+                    )
             
             except Exception as e:
                 st.error(f"❌ Error processing file: {str(e)}")
@@ -2012,17 +2226,7 @@ def show_calculator():
         
         # Disclaimer section for CO2 calculator
         st.markdown("---")
-        st.markdown("""
-        <div style='background-color: #fff3cd; border: 1px solid #ffc107; border-radius: 10px; padding: 20px; margin: 20px 0;'>
-            <h5 style='color: #856404; text-align: center; margin-bottom: 15px;'>⚠️ CO2 Calculation Disclaimer</h5>
-            <p style='color: #856404; text-align: center; margin: 0; font-size: 14px;'>
-                CO2 emissions calculations are estimates based on standard emission factors and user-provided data. 
-                Results are for informational and reporting purposes only. Actual emissions may vary based on specific 
-                circumstances, measurement accuracy, and regional factors. Rolling Sphere Technologies is not responsible 
-                for the accuracy of input data or decisions based on these calculations.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(load_asset("disclaimer_co2.html"), unsafe_allow_html=True)
         
 
 if __name__ == "__main__":
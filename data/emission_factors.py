@@ -10,6 +10,8 @@ Sources:
 All factors are approximate and may vary by region and specific circumstances
 """
 
+import numpy as np
+
 EMISSION_FACTORS = {
     # Electricity (kg CO2 per kWh)
     'electricity': {
@@ -410,6 +412,63 @@ EMISSION_FACTORS = {
     }
 }
 
+# Flattened lookup tables built once at import: a single tuple-keyed
+# dict get replaces the three nested lookups on the calculation hot path.
+# Fallback order matches the nested layout: exact unit, then the
+# category default, then the activity default
+FLAT_FACTORS = {
+    (activity, category, unit): value
+    for activity, categories in EMISSION_FACTORS.items()
+    for category, units in categories.items() if isinstance(units, dict)
+    for unit, value in units.items() if unit != 'default'
+}
+
+CATEGORY_DEFAULTS = {
+    (activity, category): units['default']
+    for activity, categories in EMISSION_FACTORS.items()
+    for category, units in categories.items()
+    if isinstance(units, dict) and 'default' in units
+}
+
+ACTIVITY_DEFAULTS = {
+    activity: categories['default']
+    for activity, categories in EMISSION_FACTORS.items()
+    if 'default' in categories
+}
+
+# Integer-coded factor table for vectorized lookups: rows are
+# (activity, category) pairs, columns are units plus one trailing
+# all-NaN column for unknown units. NaN marks "no unit-specific factor"
+# so the pair default applies -- 0.0 is a real factor here (renewables,
+# biomass) and cannot double as the missing sentinel
+PAIR_CODES = {pair: code for code, pair in enumerate(CATEGORY_DEFAULTS)}
+UNIT_CODES = {unit: code for code, unit in enumerate({u for _, _, u in FLAT_FACTORS})}
+UNKNOWN_UNIT_CODE = len(UNIT_CODES)
+
+FACTOR_TABLE = np.full((len(PAIR_CODES), len(UNIT_CODES) + 1), np.nan)
+for (_activity, _category, _unit), _value in FLAT_FACTORS.items():
+    FACTOR_TABLE[PAIR_CODES[(_activity, _category)], UNIT_CODES[_unit]] = _value
+
+PAIR_DEFAULTS = np.array([
+    CATEGORY_DEFAULTS.get(pair, ACTIVITY_DEFAULTS.get(pair[0], 0.0))
+    for pair in PAIR_CODES
+])
+
+def lookup_factors(pair_codes, unit_codes):
+    """Vectorized factor gather for coded pair/unit arrays, falling back
+    to the pair default where no unit-specific factor exists"""
+    gathered = FACTOR_TABLE[pair_codes, unit_codes]
+    return np.where(np.isnan(gathered), PAIR_DEFAULTS[pair_codes], gathered)
+
+# Display labels ("grid_electricity" -> "Grid Electricity") precomputed
+# once for every known activity and category key so render code does a
+# dict lookup instead of repeated replace/title calls
+ACTIVITY_LABELS = {
+    key: key.replace('_', ' ').title()
+    for activity, categories in EMISSION_FACTORS.items()
+    for key in (activity, *(k for k in categories if k != 'default'))
+}
+
 # Unit conversion factors (to convert to standard units)
 UNIT_CONVERSIONS = {
     # Energy conversions to kWh
@@ -5,7 +5,7 @@ Connects uploaded files with verified regulatory database for compliance checkin
 
 import pandas as pd
 from typing import List, Dict, Tuple, Optional
-from data.regulatory_database import RegulatoryDatabase, Regulation
+from data.regulatory_database import Regulation, get_regulatory_database
 
 class ComplianceEngine:
     """
@@ -13,7 +13,7 @@ class ComplianceEngine:
     """
     
     def __init__(self):
-        self.db = RegulatoryDatabase()
+        self.db = get_regulatory_database()
         # Define regulation-specific legal limits for hazardous substances (in ppm)
         self.regulation_limits = {
             'RoHS Directive': {
@@ -93,7 +93,7 @@ class ComplianceEngine:
         
         # Calculate compliance statistics
         total_components = len(material_analysis)
-        compliant_components = len([m for m in material_analysis if m['status'] == 'COMPLIANT'])
+        compliant_components = sum(1 for m in material_analysis if m['status'] == 'COMPLIANT')
         compliance_rate = (compliant_components / total_components * 100) if total_components > 0 else 100
         
         # Determine overall status
@@ -103,8 +103,8 @@ class ComplianceEngine:
         recommendations = self._generate_specific_recommendations(material_analysis)
         
         # Count regulations by region
-        eu_count = len([r for r in verified_regulations if r.region == 'European Union'])
-        usa_count = len([r for r in verified_regulations if r.region == 'Other Regions' and r.country == 'USA'])
+        eu_count = sum(1 for r in verified_regulations if r.region == 'European Union')
+        usa_count = sum(1 for r in verified_regulations if r.region == 'Other Regions' and r.country == 'USA')
         
         analysis_results = {
             'file_processed': True,
@@ -400,7 +400,7 @@ class ComplianceEngine:
                     recommendations.append(f"Contact {material['supplier']} about {material['substance']} levels ({material['concentration']} ppm exceeds {material['legal_limit']} ppm limit)")
         
         # Add general recommendations if there are compliance issues
-        non_compliant_count = len([m for m in material_analysis if m['status'] == 'NON-COMPLIANT'])
+        non_compliant_count = sum(1 for m in material_analysis if m['status'] == 'NON-COMPLIANT')
         if non_compliant_count > 0:
             recommendations.extend([
                 "Implement emergency supplier audit for non-compliant components",
@@ -1,6 +1,9 @@
 import pandas as pd
 from datetime import datetime
-from data.emission_factors import EMISSION_FACTORS
+from data.emission_factors import (
+    EMISSION_FACTORS, FLAT_FACTORS, CATEGORY_DEFAULTS, ACTIVITY_DEFAULTS,
+    PAIR_CODES, UNIT_CODES, UNKNOWN_UNIT_CODE, lookup_factors
+)
 import numpy as np
 
 class EmissionsCalculator:
@@ -35,66 +38,85 @@ class EmissionsCalculator:
                 }
             }
             
-            total_emissions = 0
-            
-            for index, row in df.iterrows():
-                activity_type = str(row.get('activity_type', '')).lower().strip()
-                category = str(row.get('category', '')).lower().strip()
-                amount = float(row.get('amount', 0))
-                unit = str(row.get('unit', '')).lower().strip()
-                date = row.get('date', '')
-                
-                # Get emission factor
-                emission_factor = self._get_emission_factor(activity_type, category, unit)
-                
-                if emission_factor > 0:
-                    # Calculate CO2 emissions
-                    co2_emissions = amount * emission_factor
-                    total_emissions += co2_emissions
-                    
-                    # Store detailed result
-                    detail = {
-                        'activity_type': activity_type,
-                        'category': category,
-                        'amount': amount,
-                        'unit': unit,
-                        'emission_factor': emission_factor,
-                        'co2_emissions_kg': co2_emissions,
-                        'date': date
-                    }
-                    results['detailed_results'].append(detail)
-                    
-                    # Categorize by GHG Protocol Scope
-                    scope = self._get_ghg_scope(activity_type)
-                    results['by_scope'][scope]['total_kg'] += co2_emissions
-                    if activity_type not in results['by_scope'][scope]['activities']:
-                        results['by_scope'][scope]['activities'].append(activity_type)
-                    if category not in results['by_scope'][scope]['categories']:
-                        results['by_scope'][scope]['categories'].append(category)
-                    
-                    # Aggregate by activity type
-                    if activity_type in results['by_activity']:
-                        results['by_activity'][activity_type] += co2_emissions
-                    else:
-                        results['by_activity'][activity_type] = co2_emissions
-                    
-                    # Aggregate by category
-                    if category in results['by_category']:
-                        results['by_category'][category] += co2_emissions
-                    else:
-                        results['by_category'][category] = co2_emissions
-                    
-                    # Aggregate by month if date is available
-                    if date:
-                        try:
-                            month_key = pd.to_datetime(date).strftime('%Y-%m')
-                            if month_key in results['monthly_emissions']:
-                                results['monthly_emissions'][month_key] += co2_emissions
-                            else:
-                                results['monthly_emissions'][month_key] = co2_emissions
-                        except:
-                            pass  # Skip if date parsing fails
-            
+            # Normalized working columns; missing columns fall back to
+            # the same defaults the old per-row .get calls used
+            def column(name, default=''):
+                if name in df.columns:
+                    return df[name]
+                return pd.Series(default, index=df.index)
+
+            work = pd.DataFrame(index=df.index)
+            work['activity_type'] = column('activity_type').astype(str).str.lower().str.strip()
+            work['category'] = column('category').astype(str).str.lower().str.strip()
+            # float32 is ample for estimate-grade quantities and halves
+            # the bytes moved through the multiply and groupby passes
+            work['amount'] = column('amount', 0).astype('float32')
+            work['unit'] = column('unit').astype(str).str.lower().str.strip()
+            work['date'] = column('date')
+
+            # Factor resolution as a coded array gather: map the string
+            # keys to integer codes once, then pull every factor out of
+            # the contiguous table in a single indexed read
+            activity_keys = work['activity_type'].str.replace(' ', '_', regex=False)
+            category_keys = work['category'].str.replace(' ', '_', regex=False)
+            pair_codes = pd.Series(
+                list(zip(activity_keys, category_keys)), index=df.index
+            ).map(PAIR_CODES)
+            unit_codes = work['unit'].map(UNIT_CODES).fillna(UNKNOWN_UNIT_CODE).astype(int)
+
+            factors = np.zeros(len(work))
+            known_pair = pair_codes.notna().to_numpy()
+            if known_pair.any():
+                factors[known_pair] = lookup_factors(
+                    pair_codes.to_numpy()[known_pair].astype(int),
+                    unit_codes.to_numpy()[known_pair]
+                )
+            # Unknown (activity, category) pairs fall back to the
+            # activity default, or 0 when the activity is unknown too
+            if not known_pair.all():
+                factors[~known_pair] = (
+                    activity_keys[~known_pair].map(ACTIVITY_DEFAULTS).fillna(0.0)
+                )
+            work['emission_factor'] = factors
+
+            # Rows without a positive emission factor are excluded, as before
+            work = work[work['emission_factor'] > 0].copy()
+            work['co2_emissions_kg'] = work['amount'] * work['emission_factor']
+
+            total_emissions = float(work['co2_emissions_kg'].sum())
+
+            results['detailed_results'] = work[
+                ['activity_type', 'category', 'amount', 'unit',
+                 'emission_factor', 'co2_emissions_kg', 'date']
+            ].to_dict('records')
+
+            # Categorize by GHG Protocol Scope, keeping first-seen order
+            # for the activity and category lists
+            scope_map = {
+                activity: scope
+                for scope, activities in self.scope_categories.items()
+                for activity in activities
+            }
+            scopes = work['activity_type'].map(scope_map).fillna('scope_3')
+            for scope, rows in work.groupby(scopes, sort=False):
+                bucket = results['by_scope'][scope]
+                bucket['total_kg'] = float(rows['co2_emissions_kg'].sum())
+                bucket['activities'] = list(dict.fromkeys(rows['activity_type']))
+                bucket['categories'] = list(dict.fromkeys(rows['category']))
+
+            # Aggregate by activity type and by category in one C-level
+            # pass each
+            results['by_activity'] = work.groupby('activity_type', sort=False)['co2_emissions_kg'].sum().to_dict()
+            results['by_category'] = work.groupby('category', sort=False)['co2_emissions_kg'].sum().to_dict()
+
+            # Aggregate by month where dates parse; unparseable or empty
+            # dates are skipped, as before
+            months = pd.to_datetime(work['date'], errors='coerce').dt.strftime('%Y-%m')
+            has_month = months.notna()
+            results['monthly_emissions'] = (
+                work.loc[has_month, 'co2_emissions_kg'].groupby(months[has_month], sort=False).sum().to_dict()
+            )
+
             # Calculate summary statistics
             results['summary'] = {
                 'total_co2_kg': total_emissions,
@@ -122,28 +144,20 @@ class EmissionsCalculator:
         activity_type = activity_type.lower().replace(' ', '_')
         category = category.lower().replace(' ', '_')
         unit = unit.lower()
-        
-        # Look for specific emission factor
-        if activity_type in self.emission_factors:
-            activity_factors = self.emission_factors[activity_type]
-            
-            if category in activity_factors:
-                category_factors = activity_factors[category]
-                
-                # Check for unit-specific factor
-                if unit in category_factors:
-                    return category_factors[unit]
-                
-                # Use default factor if available
-                if 'default' in category_factors:
-                    return category_factors['default']
-            
-            # Use activity default if available
-            if 'default' in activity_factors:
-                return activity_factors['default']
-        
-        # Return 0 if no emission factor found
-        return 0.0
+
+        # Single flat lookup per fallback level; 0.0 is a valid factor
+        # (e.g. renewables), so test for None rather than truthiness
+        factor = FLAT_FACTORS.get((activity_type, category, unit))
+        if factor is not None:
+            return factor
+
+        # Use default factor if available
+        factor = CATEGORY_DEFAULTS.get((activity_type, category))
+        if factor is not None:
+            return factor
+
+        # Use activity default, or 0 if no emission factor found
+        return ACTIVITY_DEFAULTS.get(activity_type, 0.0)
     
     def _generate_recommendations(self, results):
         """